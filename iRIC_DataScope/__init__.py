@@ -1 +1,23 @@
 """iRIC_DataScope package."""
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import Any
+
+
+def __getattr__(name: str) -> Any:
+    # 各ツールの起動関数は numpy/pandas/h5py を読み込むため、属性アクセス時まで import を遅延する（PEP 562）。
+    # 静的な import 文のままにして、PyInstaller / Nuitka が依存を検出できるようにする。
+    value: Callable[..., Any]
+    if name == "launch_lr_wse":
+        from .lr_wse.launcher import launch_from_launcher as value
+    elif name == "launch_cross_section":
+        from .cross_section.launcher import launch_from_launcher as value
+    elif name == "launch_time_series":
+        from .time_series.launcher import launch_from_launcher as value
+    elif name == "launch_xy_value_map":
+        from .xy_value_map.launcher import launch_from_launcher as value
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
@@ -2,46 +2,132 @@
 # -*- coding: utf-8 -*-
 # iRIC_DataScope\app.py
 """iRIC_DataScope ランチャー起動用スクリプト。"""
+import os
 import sys
 import logging
+from functools import cache, partial
 from dataclasses import dataclass
 from collections.abc import Callable
 from pathlib import Path
+from typing import TYPE_CHECKING
 import tkinter as tk
-import webbrowser
+from tkinter import ttk
+import hashlib
+import threading
 import time
 
 from iRIC_DataScope.common.io_selector import IOFolderSelector
 from iRIC_DataScope.common.iric_project import is_valid_input_path
 from iRIC_DataScope.common.logging_config import setup_logging
-from iRIC_DataScope.lr_wse.launcher import launch_from_launcher as launch_lr_wse
-from iRIC_DataScope.cross_section.launcher import launch_from_launcher as launch_cross_section
-from iRIC_DataScope.time_series.launcher import launch_from_launcher as launch_time_series
-from iRIC_DataScope.xy_value_map.launcher import launch_from_launcher as launch_xy_value_map
+
+if TYPE_CHECKING:
+    import webbrowser
 
 # pyinstallerのスプラッシュを閉じる用
 try:
     import pyi_splash
 except Exception:
-    pyi_splash = None 
+    pyi_splash = None
 
 logger = logging.getLogger(__name__)
 
-"""
-重い import は起動時のスプラッシュ表示後に遅延ロードする。
-"""
+# 重い import は起動時のスプラッシュ表示後に遅延ロードする。
+# 各ツール（numpy/pandas/matplotlib を読み込む）は起動ボタン押下時に import する。
 
 SPLASH_REL_PATH = Path("iRIC_DataScope") / "assets" / "splash.png"
 _APP_DIR = Path(__file__).resolve().parent
 APP_TITLE = "iRIC解析結果抽出・可視化アプリ"
 MANUAL_URL = "https://trite-entrance-e6b.notion.site/iRIC_tools-1f4ed1e8e79f8084bf81e7cf1b960727?pvs=73"
 DOCS_URL = "https://pckk-solvers.github.io/iRIC_DataScope/"
+# 入力パス判定キャッシュの上限（超えたら丸ごと破棄する）
+INPUT_VALID_CACHE_SIZE = 32
+# パス入力の検証を遅延させる時間（ms）
+VALIDATE_DEBOUNCE_MS = 100
 BUTTON_LABELS = {
     "lr_wse": "左右岸水位抽出",
     "cross_section": "横断重ね合わせ図作成",
     "time_series": "時系列データ抽出",
     "xy_value_map": "X-Y分布画像出力",
 }
+# (key, button_attr, window_attr, log_name, close_binding)
+_TOOL_STATIC = (
+    ("lr_wse", "btn_lr_wse", "_lr_wse_win", "LrWseGUI", "protocol"),
+    ("cross_section", "btn_cross_section", "_cross_section_win", "ProfilePlotGUI", "protocol"),
+    ("time_series", "btn_time_series", "_time_series_win", "TimeSeriesGUI", "protocol"),
+    ("xy_value_map", "btn_xy_map", "_xy_map_win", "XYValueMapGUI", "destroy"),
+)
+TOOL_KEYS = tuple(row[0] for row in _TOOL_STATIC)
+
+
+def _load_launcher(key: str) -> Callable:
+    """ツールの launch_from_launcher を返す（初回アクセス時にパッケージ側で遅延 import される）"""
+    import iRIC_DataScope
+
+    return getattr(iRIC_DataScope, f"launch_{key}")
+
+
+@cache
+def _resolve_resource(relative_path: str) -> Path:
+    """同梱リソースの実パスを解決する（結果はプロセス内でキャッシュする）"""
+    # Support both PyInstaller (sys._MEIPASS) and Nuitka (no _MEIPASS).
+    rel = Path(relative_path)
+    rel_stripped = Path(*rel.parts[1:]) if rel.parts[:1] == ("iRIC_DataScope",) else rel
+    bases: list[Path] = []
+    if getattr(sys, "frozen", False):
+        meipass = getattr(sys, "_MEIPASS", None)
+        if meipass:
+            bases.append(Path(meipass))
+        exe = getattr(sys, "executable", None)
+        if exe:
+            bases.append(Path(exe).resolve().parent)
+        bases.append(Path.cwd())
+    else:
+        bases.append(_APP_DIR)
+
+    for base in bases:
+        for rp in (rel, rel_stripped):
+            candidate = base / rp
+            if candidate.is_file():
+                return candidate
+
+    # Fallback for dev mode
+    return _APP_DIR / rel_stripped
+
+
+def _user_cache_dir() -> Path:
+    """ユーザーごとのキャッシュフォルダ（共有の一時フォルダと違い、他のユーザーはファイルを置けない）"""
+    if os.name == "nt":
+        base = os.environ.get("LOCALAPPDATA") or Path.home() / "AppData" / "Local"
+    else:
+        base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "iRIC_DataScope"
+
+
+def _center_on_screen(win: tk.Tk | tk.Toplevel, width: int, height: int) -> None:
+    """ウィンドウを指定サイズで画面中央に配置する（スプラッシュ／メイン共通）"""
+    x = (win.winfo_screenwidth() - width) // 2
+    y = (win.winfo_screenheight() - height) // 2
+    win.geometry(f"{width}x{height}+{x}+{y}")
+
+
+class _Phase:
+    """起動処理の各段階の所要時間を DEBUG ログに出す（enabled=False なら何もしない）"""
+
+    __slots__ = ("name", "enabled", "t0")
+
+    def __init__(self, name: str, enabled: bool):
+        self.name = name
+        self.enabled = enabled
+        self.t0 = 0.0
+
+    def __enter__(self) -> "_Phase":
+        if self.enabled:
+            self.t0 = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        if self.enabled:
+            logger.debug("LauncherApp: %s in %.3fs", self.name, time.perf_counter() - self.t0)
 
 
 @dataclass(frozen=True)
@@ -54,6 +140,7 @@ class ToolSpec:
     close_binding: str  # "protocol" or "destroy"
     open_fn: Callable
 
+
 class LauncherApp(tk.Tk):
     """
     iRIC 統合ランチャー アプリケーションクラス
@@ -61,6 +148,8 @@ class LauncherApp(tk.Tk):
     - 各種ツール起動ボタン
     - ヘルプメニュー＆マニュアルボタン
     """
+    _browser: "webbrowser.BaseBrowser | None" = None
+
     def __init__(
         self,
         *,
@@ -69,15 +158,23 @@ class LauncherApp(tk.Tk):
     ):
         super().__init__()
         self.withdraw()
-        self._show_internal_splash = show_splash
+        # PyInstaller のネイティブスプラッシュがある場合は Tk 側のスプラッシュを出さない
+        self._show_internal_splash = show_splash and pyi_splash is None
         self._on_ready = on_ready
         self._splash = None
         self._splash_image = None
+        # 未作成のスプラッシュ PPM キャッシュの書き出し先
+        self._splash_cache_path: Path | None = None
+        # 入力パス判定（ワーカースレッド）の世代番号。古い判定結果を破棄するために使う。
+        self._validate_token = 0
+        # 有効と判定された入力パス文字列。同じパスでフォルダ走査を繰り返さないためのキャッシュ。
+        # 無効の結果は残さない（利用者がフォルダを直した後、選び直せば再判定されるように）。
+        self._input_valid_cache: set[str] = set()
+        # 入力中の連続した変更をまとめて検証するための after ID
+        self._validate_after: str | None = None
         if self._show_internal_splash:
             self._show_splash()
         self._safe_update()
-        self._close_pyi_splash()
-        self._safe_update()
         self._setup_logging()
         self._initialize_ui()
         # 既存ウィンドウを保持する変数
@@ -89,9 +186,10 @@ class LauncherApp(tk.Tk):
         self.after(0, self._finish_startup)
 
     def _safe_update(self) -> None:
+        # update() はイベントを再入的に処理し、初期化途中のハンドラが走り得るため使わない。
+        # 描画・ジオメトリの反映だけなら update_idletasks() で足りる。
         try:
             self.update_idletasks()
-            self.update()
         except Exception:
             pass
 
@@ -109,36 +207,49 @@ class LauncherApp(tk.Tk):
         self._safe_call(setup_logging, "setup logging")
 
     def _initialize_ui(self) -> None:
-        start = time.perf_counter()
-        logger.debug("LauncherApp: Starting initialization")
-        # 1. ウィンドウ設定
-        self._configure_window()
-        logger.debug("LauncherApp: Window configured in %.3fs", time.perf_counter() - start)
-        # 2. メニューバー（ヘルプ）作成
-        self._create_menu()
-        logger.debug("LauncherApp: Menu created in %.3fs", time.perf_counter() - start)
-        # 3. IO フォルダ選択パネル作成
-        self._create_io_panel()
-        logger.debug("LauncherApp: IO panel created in %.3fs", time.perf_counter() - start)
-        # 4. 各機能起動ボタン作成
-        self._create_launch_buttons()
-        logger.debug("LauncherApp: Launch buttons created in %.3fs", time.perf_counter() - start)
-        # 5. イベントバインド（パス検証・ショートカットキー）
-        self._bind_events()
-        logger.debug("LauncherApp: Events bound in %.3fs", time.perf_counter() - start)
-        # 6. 自動レイアウト調整：ウィジェットに合わせて初期サイズ＆最小サイズを設定
-        self._finalize_layout()
-        logger.debug("LauncherApp: Layout finalized in %.3fs", time.perf_counter() - start)
-        logger.debug("LauncherApp: Initialization complete in %.3fs", time.perf_counter() - start)
+        dbg = logger.isEnabledFor(logging.DEBUG)
+        if dbg:
+            logger.debug("LauncherApp: Starting initialization")
+        with _Phase("Initialization complete", dbg):
+            # 1. ウィンドウ設定（タイトルのみ。サイズは 6. で配置後に決める）
+            with _Phase("Window configured", dbg):
+                self.title(APP_TITLE)
+            # 2. メニューバー（ヘルプ）作成
+            with _Phase("Menu created", dbg):
+                self._create_menu()
+            # 3. IO フォルダ選択パネル作成
+            with _Phase("IO panel created", dbg):
+                self._create_io_panel()
+            # 4. 各機能起動ボタン作成
+            with _Phase("Launch buttons created", dbg):
+                self._create_launch_buttons()
+            # 5. イベントバインド（パス検証・ショートカットキー）
+            with _Phase("Events bound", dbg):
+                self._bind_events()
+            # 6. 自動レイアウト調整：ウィジェットに合わせて初期サイズ＆最小サイズを設定
+            with _Phase("Layout finalized", dbg):
+                self._finalize_layout()
 
     def _finish_startup(self) -> None:
         self.deiconify()
         self.update_idletasks()   # 初回描画を出す
+        # ネイティブスプラッシュはウィジェット生成中も表示し続け、メイン画面が出てから閉じる
+        self._close_pyi_splash()
         if self._on_ready:
             self._safe_call(self._on_ready, "signal readiness")
         if self._show_internal_splash:
             self._hide_splash()
         self.lift()
+        # 初回描画後に各ツールを裏で import しておき、初回クリック時の待ちを減らす
+        threading.Thread(target=self._prewarm_launchers, daemon=True).start()
+
+    def _prewarm_launchers(self) -> None:
+        # Tk には触れず import のみ行う（ワーカースレッドから呼ばれる）
+        for key in TOOL_KEYS:
+            try:
+                _load_launcher(key)
+            except Exception as exc:
+                logger.debug("LauncherApp: Failed to prewarm %s: %s", key, exc)
 
     def _safe_call(self, func: Callable, context: str) -> None:
         try:
@@ -147,31 +258,7 @@ class LauncherApp(tk.Tk):
             logger.debug("LauncherApp: Failed to %s: %s", context, exc)
 
     def _resource_path(self, relative_path: Path) -> Path:
-        # Support both PyInstaller (sys._MEIPASS) and Nuitka (no _MEIPASS).
-        rel = relative_path
-        rel_stripped = (
-            Path(*relative_path.parts[1:]) if relative_path.parts[:1] == ("iRIC_DataScope",) else relative_path
-        )
-        bases: list[Path] = []
-        if getattr(sys, "frozen", False):
-            meipass = getattr(sys, "_MEIPASS", None)
-            if meipass:
-                bases.append(Path(meipass))
-            exe = getattr(sys, "executable", None)
-            if exe:
-                bases.append(Path(exe).resolve().parent)
-            bases.append(Path.cwd())
-        else:
-            bases.append(_APP_DIR)
-
-        for base in bases:
-            for rp in (rel, rel_stripped):
-                candidate = base / rp
-                if candidate.is_file():
-                    return candidate
-
-        # Fallback for dev mode
-        return _APP_DIR / rel_stripped
+        return _resolve_resource(str(relative_path))
 
     def _show_splash(self) -> None:
         splash_path = self._resource_path(SPLASH_REL_PATH)
@@ -187,7 +274,7 @@ class LauncherApp(tk.Tk):
         splash.attributes("-topmost", True)
 
         try:
-            image = tk.PhotoImage(file=str(splash_path))
+            image = self._load_splash_image(splash_path)
         except Exception as exc:
             logger.warning("LauncherApp: Failed to load splash image: %s", exc)
             self.deiconify()
@@ -196,13 +283,8 @@ class LauncherApp(tk.Tk):
         label = tk.Label(splash, image=image, borderwidth=0, highlightthickness=0)
         label.pack()
 
-        # 画像サイズが確定した状態で geometry を決める
-        splash.update_idletasks()
-        width = image.width()
-        height = image.height()
-        x = (splash.winfo_screenwidth() - width) // 2
-        y = (splash.winfo_screenheight() - height) // 2
-        splash.geometry(f"{width}x{height}+{x}+{y}")
+        # geometry は画像自体のサイズから決まるため、レイアウト計算を待つ必要はない
+        _center_on_screen(splash, image.width(), image.height())
 
         splash.deiconify()  # ★位置が決まってから表示
         splash.lift()
@@ -218,18 +300,46 @@ class LauncherApp(tk.Tk):
         self._splash = splash
         self._splash_image = image  # keep reference
 
+    def _load_splash_image(self, splash_path: Path) -> tk.PhotoImage:
+        # PNG の展開を避けるため、前回起動時に書き出した PPM（Tk ネイティブ形式）があればそれを使う。
+        # PyInstaller/Nuitka の onefile は起動ごとに展開され mtime が変わるため、内容のハッシュをキーにする
+        # （同じサイズの画像に差し替えた場合も作り直される）。
+        digest = hashlib.sha256(splash_path.read_bytes()).hexdigest()[:16]
+        cache_path = _user_cache_dir() / f"splash_{digest}.ppm"
+        if cache_path.is_file():
+            try:
+                return tk.PhotoImage(file=os.fspath(cache_path))
+            except tk.TclError as exc:
+                logger.debug("LauncherApp: Ignoring broken splash cache %s: %s", cache_path, exc)
+        image = tk.PhotoImage(file=os.fspath(splash_path))
+        self._splash_cache_path = cache_path
+        return image
+
+    def _write_splash_cache(self) -> None:
+        cache_path = self._splash_cache_path
+        if cache_path is None or self._splash_image is None:
+            return
+        self._splash_cache_path = None
+        tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+        try:
+            cache_path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+            self._splash_image.write(os.fspath(tmp_path), format="ppm")
+            os.replace(tmp_path, cache_path)
+        except (OSError, tk.TclError) as exc:
+            logger.debug("LauncherApp: Failed to write splash cache: %s", exc)
+            try:
+                tmp_path.unlink(missing_ok=True)
+            except OSError:
+                pass
+
     def _hide_splash(self) -> None:
+        # メインウィンドウ表示後なので、次回起動用のキャッシュ書き出しはここで行う
+        self._write_splash_cache()
         if self._splash and self._splash.winfo_exists():
             self._splash.destroy()
         self._splash = None
         self._splash_image = None
 
-    def _configure_window(self):
-        """ウィンドウのタイトルと初期サイズを設定"""
-        logger.debug("LauncherApp: Configuring main window")
-        self.title(APP_TITLE)
-        # self.geometry("600x330")
-
     def _finalize_layout(self):
         """
         ウィジェット配置後に必要最小サイズを計算し、
@@ -246,16 +356,12 @@ class LauncherApp(tk.Tk):
         margin_x, margin_y = 20, 20
         self.minsize(w+margin_x, h+margin_y)
         self._center_window(w + margin_x, h + margin_y)
-        logger.debug(f"LauncherApp: Geometry set to {w+margin_x}x{h+margin_y}")
+        logger.debug("LauncherApp: Geometry set to %dx%d", w + margin_x, h + margin_y)
 
     def _center_window(self, width: int, height: int) -> None:
         if width <= 0 or height <= 0:
             return
-        screen_w = self.winfo_screenwidth()
-        screen_h = self.winfo_screenheight()
-        x = (screen_w - width) // 2
-        y = (screen_h - height) // 2
-        self.geometry(f"{width}x{height}+{x}+{y}")
+        _center_on_screen(self, width, height)
 
     def _create_menu(self):
         """メニューバーとヘルプメニューを追加"""
@@ -283,96 +389,137 @@ class LauncherApp(tk.Tk):
         logger.debug("LauncherApp: Creating launch buttons")
         self._tool_specs = self._build_tool_specs()
         self._tool_buttons = []
+        # ボタンは無効状態で作成する
+        self._tool_buttons_state = False
         for spec in self._tool_specs:
             btn = tk.Button(
                 self,
                 text=spec.label,
-                command=lambda s=spec: self._open_tool(s),
+                command=partial(self._open_tool, spec),
                 state="disabled",
             )
             setattr(self, spec.button_attr, btn)
             btn.pack(fill="x", padx=20, pady=5)
             self._tool_buttons.append(btn)
+        # 入力パスの判定（フォルダ走査）中だけ動かすインジケータ
+        self._validate_progress = ttk.Progressbar(self, mode="indeterminate")
+        self._validate_progress.pack(fill="x", padx=20, pady=(5, 10))
         logger.debug("LauncherApp: Launch buttons created")
 
     def _bind_events(self):
         """入力/出力パス検証と Alt+H ショートカットをバインド"""
         logger.debug("LauncherApp: Binding events")
         # パス入力変更で有効化チェック
-        self.io_panel.input_selector.var.trace_add("write", self._validate)
-        self.io_panel.output_selector.var.trace_add("write", self._validate)
+        self.io_panel.input_selector.var.trace_add("write", self._schedule_validate)
+        self.io_panel.output_selector.var.trace_add("write", self._schedule_validate)
         # Alt+H でマニュアルオープン
         self.bind_all("<Alt-h>", lambda e: self.open_manual())
         logger.debug("LauncherApp: Events bound")
 
+    def _schedule_validate(self, *args):
+        # キー入力ごとに走査しないよう、最後の変更から一定時間後に一度だけ検証する
+        if self._validate_after is not None:
+            self.after_cancel(self._validate_after)
+        self._validate_after = self.after(VALIDATE_DEBOUNCE_MS, self._run_scheduled_validate)
+
+    def _run_scheduled_validate(self) -> None:
+        self._validate_after = None
+        self._validate()
+
     def _validate(self, *args):
         """
         入力／出力フォルダの存在をチェックして、
         両方そろったときだけ起動ボタンを有効化、
         そうでなければ無効化する
+
+        入力パスの判定はフォルダ走査を伴うため、ワーカースレッドで実行して
+        Tk のイベントループを止めないようにする。
         """
         in_dir = self.io_panel.input_selector.var.get()
         out_dir = self.io_panel.output_selector.var.get()
-        in_path = Path(in_dir) if in_dir else None
-        out_path = Path(out_dir) if out_dir else None
-        in_ok = self._is_valid_input_path(in_path)
-        out_ok = self._is_valid_output_path(out_path)
-        ok = in_ok and out_ok
-        self._set_tool_buttons_state(ok)
-        logger.debug(f"LauncherApp: Validation result: input='{in_dir}', output='{out_dir}', buttons_enabled={ok}")
+        out_ok = self._is_valid_output_path(out_dir)
+        self._validate_token += 1
+        token = self._validate_token
+        if not (out_ok and in_dir):
+            self._apply_validation(token, False, in_dir, out_dir)
+            return
+        if in_dir in self._input_valid_cache:
+            self._apply_validation(token, True, in_dir, out_dir)
+            return
+        if not os.path.isdir(in_dir):
+            # .ipro / .cgn の判定は拡張子と存在確認だけなので走査不要
+            self._apply_validation(token, self._is_valid_input_path(in_dir), in_dir, out_dir)
+            return
+        # 判定が終わるまでは起動ボタンを無効化しておく
+        self._set_tool_buttons_state(False)
+        self._validate_progress.start(50)
+
+        def worker():
+            # ワーカーでは判定だけを行い、キャッシュの更新は Tk スレッド側（_apply_validation）で行う
+            in_ok = self._is_valid_input_path(in_dir)
+            try:
+                self.after(0, lambda: self._apply_validation(token, in_ok, in_dir, out_dir, cache=True))
+            except (RuntimeError, tk.TclError):
+                # ランチャー終了後に判定が完了した場合は何もしない
+                pass
+
+        threading.Thread(target=worker, daemon=True).start()
+
+    def _apply_validation(
+        self, token: int, in_ok: bool, in_dir: str, out_dir: str, *, cache: bool = False
+    ) -> None:
+        if token != self._validate_token:
+            # 判定中にパスが変更された場合は古い結果を捨てる
+            return
+        if cache and in_ok:
+            if len(self._input_valid_cache) >= INPUT_VALID_CACHE_SIZE:
+                self._input_valid_cache.clear()
+            self._input_valid_cache.add(in_dir)
+        self._validate_progress.stop()
+        self._set_tool_buttons_state(in_ok)
+        logger.debug(
+            "LauncherApp: Validation result: input='%s', output='%s', buttons_enabled=%s",
+            in_dir,
+            out_dir,
+            in_ok,
+        )
 
-    def _is_valid_input_path(self, in_path: Path | None) -> bool:
-        return is_valid_input_path(in_path)
+    def _is_valid_input_path(self, in_dir: str) -> bool:
+        return is_valid_input_path(in_dir)
 
-    def _is_valid_output_path(self, out_path: Path | None) -> bool:
-        return bool(out_path and out_path.is_dir())
+    def _is_valid_output_path(self, out_dir: str) -> bool:
+        return bool(out_dir) and os.path.isdir(out_dir)
 
     def _set_tool_buttons_state(self, enabled: bool) -> None:
+        if enabled == self._tool_buttons_state:
+            return
+        self._tool_buttons_state = enabled
         state = "normal" if enabled else "disabled"
         for btn in self._tool_buttons:
             btn.configure(state=state)
 
     def _build_tool_specs(self) -> list[ToolSpec]:
+        open_fns = {
+            "lr_wse": self._launch_lr_wse,
+            "cross_section": self._launch_cross_section,
+            "time_series": self._launch_time_series,
+            "xy_value_map": self._launch_xy_value_map,
+        }
         return [
-            ToolSpec(
-                key="lr_wse",
-                label=BUTTON_LABELS["lr_wse"],
-                button_attr="btn_lr_wse",
-                window_attr="_lr_wse_win",
-                log_name="LrWseGUI",
-                close_binding="protocol",
-                open_fn=self._launch_lr_wse,
-            ),
-            ToolSpec(
-                key="cross_section",
-                label=BUTTON_LABELS["cross_section"],
-                button_attr="btn_cross_section",
-                window_attr="_cross_section_win",
-                log_name="ProfilePlotGUI",
-                close_binding="protocol",
-                open_fn=self._launch_cross_section,
-            ),
-            ToolSpec(
-                key="time_series",
-                label=BUTTON_LABELS["time_series"],
-                button_attr="btn_time_series",
-                window_attr="_time_series_win",
-                log_name="TimeSeriesGUI",
-                close_binding="protocol",
-                open_fn=self._launch_time_series,
-            ),
-            ToolSpec(
-                key="xy_value_map",
-                label=BUTTON_LABELS["xy_value_map"],
-                button_attr="btn_xy_map",
-                window_attr="_xy_map_win",
-                log_name="XYValueMapGUI",
-                close_binding="destroy",
-                open_fn=self._launch_xy_value_map,
-            ),
+            ToolSpec(key, BUTTON_LABELS[key], button_attr, window_attr, log_name, close_binding, open_fns[key])
+            for key, button_attr, window_attr, log_name, close_binding in _TOOL_STATIC
         ]
 
     def _open_tool(self, spec: ToolSpec) -> None:
+        win = getattr(self, spec.window_attr)
+        # 破棄時は <Destroy> で必ず None に戻すため、winfo_exists() での確認は不要
+        if win is not None:
+            logger.debug("LauncherApp: %s already open, lifting window", spec.log_name)
+            win.lift()
+            return
+        # ツール側で入力フォルダの内容が変わり得るため、判定キャッシュを破棄する
+        self._input_valid_cache.clear()
+        # パスはクリックごとに一度だけ取得し、以降はこの値を使い回す
         out_dir = self.io_panel.get_output_dir()
         in_path = self.io_panel.get_input_dir()
         logger.info(
@@ -381,19 +528,14 @@ class LauncherApp(tk.Tk):
             in_path,
             out_dir,
         )
-        win = getattr(self, spec.window_attr)
-        if win and win.winfo_exists():
-            logger.debug("LauncherApp: %s already open, lifting window", spec.log_name)
-            win.lift()
-            return
         new_win = spec.open_fn(self, input_path=in_path, output_dir=out_dir)
         if new_win is None:
             return
         setattr(self, spec.window_attr, new_win)
         if spec.close_binding == "protocol":
-            new_win.protocol("WM_DELETE_WINDOW", lambda s=spec: self._on_tool_close(s))
-        else:
-            new_win.bind("<Destroy>", lambda event, s=spec: self._on_tool_destroy(event, s))
+            new_win.protocol("WM_DELETE_WINDOW", partial(self._on_tool_close, spec))
+        # ツール自身が destroy() した場合も含め、破棄の検知は <Destroy> に一本化する
+        new_win.bind("<Destroy>", partial(self._on_tool_destroy, spec), add="+")
         logger.debug("LauncherApp: %s window created", spec.log_name)
 
     def _on_tool_close(self, spec: ToolSpec) -> None:
@@ -403,7 +545,7 @@ class LauncherApp(tk.Tk):
             win.destroy()
         setattr(self, spec.window_attr, None)
 
-    def _on_tool_destroy(self, event, spec: ToolSpec) -> None:
+    def _on_tool_destroy(self, spec: ToolSpec, event) -> None:
         win = getattr(self, spec.window_attr)
         if event.widget is win:
             logger.debug("LauncherApp: %s destroyed", spec.log_name)
@@ -411,48 +553,66 @@ class LauncherApp(tk.Tk):
 
     def _launch_lr_wse(self, master: tk.Misc, *, input_path: Path, output_dir: Path):
         """左右岸水位抽出ツールを開く"""
-        return self._safe_open_tool(
-            lambda: launch_lr_wse(master, input_path=input_path, output_dir=output_dir),
-            "LrWseGUI",
-        )
+        try:
+            return _load_launcher("lr_wse")(master, input_path=input_path, output_dir=output_dir)
+        except Exception as exc:
+            logger.warning("LauncherApp: Failed to open LrWseGUI: %s", exc)
+            return None
 
     def _launch_cross_section(self, master: tk.Misc, *, input_path: Path, output_dir: Path):
         """横断重ね合わせ図作成ツールを開く"""
-        return self._safe_open_tool(
-            lambda: launch_cross_section(master, input_path=input_path, output_dir=output_dir),
-            "ProfilePlotGUI",
-        )
+        try:
+            return _load_launcher("cross_section")(master, input_path=input_path, output_dir=output_dir)
+        except Exception as exc:
+            logger.warning("LauncherApp: Failed to open ProfilePlotGUI: %s", exc)
+            return None
 
     def _launch_time_series(self, master: tk.Misc, *, input_path: Path, output_dir: Path):
         """時系列抽出ツール GUI を起動"""
-        return self._safe_open_tool(
-            lambda: launch_time_series(master, input_path=input_path, output_dir=output_dir),
-            "TimeSeriesGUI",
-        )
+        try:
+            return _load_launcher("time_series")(master, input_path=input_path, output_dir=output_dir)
+        except Exception as exc:
+            logger.warning("LauncherApp: Failed to open TimeSeriesGUI: %s", exc)
+            return None
 
     def _launch_xy_value_map(self, master: tk.Misc, *, input_path: Path, output_dir: Path):
         """X-Y分布画像出力ツールを開く（プロジェクト/CSVフォルダ/.ipro/.cgn を直接読み込む）"""
-        return self._safe_open_tool(
-            lambda: launch_xy_value_map(master, input_path=input_path, output_dir=output_dir),
-            "XYValueMapGUI",
-        )
-
-    def _safe_open_tool(self, launcher: Callable, log_name: str):
         try:
-            return launcher()
+            return _load_launcher("xy_value_map")(master, input_path=input_path, output_dir=output_dir)
         except Exception as exc:
-            logger.warning("LauncherApp: Failed to open %s: %s", log_name, exc)
+            logger.warning("LauncherApp: Failed to open XYValueMapGUI: %s", exc)
             return None
 
     def open_manual(self):
         """Notion のマニュアルを既定ブラウザで開く"""
         logger.info("LauncherApp: Opening manual URL: %s", MANUAL_URL)
-        webbrowser.open(MANUAL_URL)
+        self._open_url(MANUAL_URL)
 
     def open_docs(self):
         """GitHub Pages のユーザーマニュアルを既定ブラウザで開く"""
         logger.info("LauncherApp: Opening docs URL: %s", DOCS_URL)
-        webbrowser.open(DOCS_URL)
+        self._open_url(DOCS_URL)
+
+    def _open_url(self, url: str) -> None:
+        # webbrowser は subprocess/shlex などを連れてくるため、使う時まで import しない
+        import webbrowser
+
+        # ブラウザ検出は環境によって重いため、初回に取得したコントローラを使い回す
+        if LauncherApp._browser is None:
+            try:
+                LauncherApp._browser = webbrowser.get()
+            except webbrowser.Error as exc:
+                logger.debug("LauncherApp: Failed to get browser controller: %s", exc)
+                webbrowser.open(url)
+                return
+        try:
+            opened = LauncherApp._browser.open(url)
+        except Exception as exc:
+            logger.debug("LauncherApp: Cached browser failed: %s", exc)
+            opened = False
+        if not opened:
+            # 使い回したブラウザで開けない場合は、webbrowser.open に候補を順に試させる
+            webbrowser.open(url)
 
 def main(
     argv: list[str] | None = None,
@@ -468,7 +628,6 @@ def main(
         in_arg, out_arg = args
         app.io_panel.input_selector.var.set(in_arg)
         app.io_panel.output_selector.var.set(out_arg)
-        app._validate()
     app.mainloop()
 
 
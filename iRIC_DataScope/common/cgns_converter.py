@@ -1,20 +1,41 @@
 from __future__ import annotations
 
 import logging
-import shutil
+from concurrent.futures import ProcessPoolExecutor
 import tempfile
-import zipfile
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Generator, Literal, TYPE_CHECKING
 
+from .iric_project import (
+    discover_project_cgns,
+    extract_zip_members,
+    list_solution_cgns_in_ipro,
+    parse_solution_step,
+)
+
 logger = logging.getLogger(__name__)
 
 if TYPE_CHECKING:
+    from types import ModuleType
+
     from iRIC_DataScope.common.cgns_reader import IricStepFrame
 
 
-@dataclass
+# h5py/numpy/pandas を読み込むモジュールは初回利用時に import する（2 回目以降は sys.modules から返る）
+def _get_reader() -> ModuleType:
+    from . import cgns_reader
+
+    return cgns_reader
+
+
+def _get_writer() -> ModuleType:
+    from . import iric_csv_writer
+
+    return iric_csv_writer
+
+
+@dataclass(frozen=True, slots=True)
 class ConversionOptions:
     """
     プロジェクトフォルダ / IPRO から iRIC 互換 CSV を生成する際のオプション
@@ -26,6 +47,12 @@ class ConversionOptions:
     include_flow_solution:
       - True の場合、FlowSolution 系のスカラーを出力（形状が座標と一致するもののみ）
       - False の場合、座標のみを出力
+    float_dtype:
+      - None の場合、CGNS の型のまま出力
+      - "float32" などを指定すると、座標と浮動小数の変数をその型に落としてから出力
+        （桁数が減り CSV の書き出しが軽くなるが、精度も落ちる）
+    workers:
+      - 単一 CGNS のステップ出力を並列化するプロセス数（1 の場合は逐次処理）
     """
 
     case_name: str = "Case1.cgn"
@@ -37,15 +64,15 @@ class ConversionOptions:
     fortran_order: bool = True
     location_preference: Literal["auto", "vertex", "cell"] = "auto"
     include_flow_solution: bool = True
+    float_dtype: str | None = None
+    workers: int = 1
 
 
 def resolve_case_cgn(input_path: Path, case_name: str):
     """
     入力（.ipro / dir）から CGNS を解決する contextmanager を返す。
     """
-    from .cgns_reader import resolve_case_cgn as _resolve
-
-    return _resolve(input_path, case_name)
+    return _get_reader().resolve_case_cgn(input_path, case_name)
 
 
 def export_iric_like_csv(
@@ -60,26 +87,61 @@ def export_iric_like_csv(
     fortran_order: bool = True,
     location_preference: Literal["auto", "vertex", "cell"] = "auto",
     include_flow_solution: bool = True,
+    float_dtype: str | None = None,
+    workers: int = 1,
 ) -> None:
     """
     CGNS を読み込み iRIC 互換の Result_*.csv を out_dir に出力する。
-    """
-    from .cgns_reader import iter_iric_step_frames
-    from .iric_csv_writer import export_iric_result_csv
 
+    workers > 1 の場合、対象ステップを workers 個の連続した範囲に分け、
+    各範囲を別プロセスで読み込み・書き出しする（各ステップの出力は互いに独立）。
+    """
     out_dir.mkdir(parents=True, exist_ok=True)
-    frames = iter_iric_step_frames(
-        cgn_path,
+    reader_kwargs = dict(
         zone_path=zone_path,
         vars_keep=vars_keep,
-        step_from=step_from,
-        step_to=step_to,
-        step_skip=step_skip,
         fortran_order=fortran_order,
         location_preference=location_preference,
         include_flow_solution=include_flow_solution,
+        float_dtype=float_dtype,
     )
-    export_iric_result_csv(frames, out_dir)
+    slices: list[range] = []
+    if workers > 1 and include_flow_solution:
+        last = _get_reader().count_flow_solutions(cgn_path, zone_path)
+        if step_to is not None:
+            last = min(last, step_to)
+        steps = range(max(1, step_from), last + 1, step_skip)
+        # 各プロセスにはファイル上で近くに並ぶ連続したステップを割り当てる
+        per_worker = -(-len(steps) // workers)
+        slices = [steps[i : i + per_worker] for i in range(0, len(steps), per_worker)]
+
+    if len(slices) <= 1:
+        _export_step_slice(
+            cgn_path, out_dir, step_from=step_from, step_to=step_to, step_skip=step_skip, **reader_kwargs
+        )
+        return
+
+    with ProcessPoolExecutor(max_workers=len(slices)) as ex:
+        futures = [
+            ex.submit(
+                _export_step_slice,
+                cgn_path,
+                out_dir,
+                step_from=s.start,
+                step_to=s[-1],
+                step_skip=step_skip,
+                **reader_kwargs,
+            )
+            for s in slices
+        ]
+        for fut in futures:
+            fut.result()
+
+
+def _export_step_slice(cgn_path: Path, out_dir: Path, **reader_kwargs) -> None:
+    # ProcessPoolExecutor から呼ばれるため、モジュールレベルに置く
+    frames = _get_reader().iter_iric_step_frames(cgn_path, **reader_kwargs)
+    _get_writer().export_iric_result_csv(frames, out_dir)
 
 
 def _iter_cgns_series_frames(
@@ -91,12 +153,12 @@ def _iter_cgns_series_frames(
     fortran_order: bool,
     location_preference: Literal["auto", "vertex", "cell"],
     include_flow_solution: bool,
+    float_dtype: str | None,
 ) -> Generator["IricStepFrame", None, None]:
-    from .cgns_reader import IricStepFrame, iter_iric_step_frames
-
+    reader = _get_reader()
     for idx, cgn_path in enumerate(cgn_paths):
         step = steps[idx]
-        gen = iter_iric_step_frames(
+        gen = reader.iter_iric_step_frames(
             cgn_path,
             zone_path=zone_path,
             vars_keep=vars_keep,
@@ -106,12 +168,13 @@ def _iter_cgns_series_frames(
             fortran_order=fortran_order,
             location_preference=location_preference,
             include_flow_solution=include_flow_solution,
+            float_dtype=float_dtype,
         )
         try:
             frame = next(gen)
         except StopIteration:
             continue
-        yield IricStepFrame(
+        yield reader.IricStepFrame(
             step=step,
             time=frame.time,
             imax=frame.imax,
@@ -131,14 +194,6 @@ def convert_iric_project(
     プロジェクトフォルダ / .ipro を受け取り、Result_*.csv を output_dir に生成する。
     戻り値は output_dir。
     """
-    from .cgns_reader import resolve_case_cgn as _resolve
-    from .iric_csv_writer import export_iric_result_csv
-    from .iric_project import (
-        discover_project_cgns,
-        list_solution_cgns_in_ipro,
-        parse_solution_step,
-    )
-
     opts = options or ConversionOptions()
     input_path = input_path.expanduser()
     output_dir = output_dir.expanduser()
@@ -161,8 +216,9 @@ def convert_iric_project(
                 fortran_order=opts.fortran_order,
                 location_preference=opts.location_preference,
                 include_flow_solution=opts.include_flow_solution,
+                float_dtype=opts.float_dtype,
             )
-            export_iric_result_csv(frames, output_dir)
+            _get_writer().export_iric_result_csv(frames, output_dir)
         else:
             export_iric_like_csv(
                 cgn_path=info.paths[0],
@@ -175,22 +231,19 @@ def convert_iric_project(
                 fortran_order=opts.fortran_order,
                 location_preference=opts.location_preference,
                 include_flow_solution=opts.include_flow_solution,
+                float_dtype=opts.float_dtype,
+                workers=opts.workers,
             )
     elif input_path.suffix.lower() == ".ipro":
         sol_names = list_solution_cgns_in_ipro(input_path)
         if sol_names:
             with tempfile.TemporaryDirectory(prefix="ipro_solution_") as td:
                 td_path = Path(td)
-                cgn_paths: list[Path] = []
+                cgn_paths = extract_zip_members(input_path, sol_names, td_path)
                 steps: list[int] = []
-                with zipfile.ZipFile(input_path, "r") as z:
-                    for idx, name in enumerate(sol_names, start=1):
-                        out = td_path / Path(name).name
-                        with z.open(name) as src, out.open("wb") as dst:
-                            shutil.copyfileobj(src, dst)
-                        cgn_paths.append(out)
-                        n = parse_solution_step(Path(name).name)
-                        steps.append(n if n is not None else idx)
+                for idx, p in enumerate(cgn_paths, start=1):
+                    n = parse_solution_step(p.name)
+                    steps.append(n if n is not None else idx)
                 frames = _iter_cgns_series_frames(
                     cgn_paths,
                     steps,
@@ -199,10 +252,11 @@ def convert_iric_project(
                     fortran_order=opts.fortran_order,
                     location_preference=opts.location_preference,
                     include_flow_solution=opts.include_flow_solution,
+                    float_dtype=opts.float_dtype,
                 )
-                export_iric_result_csv(frames, output_dir)
+                _get_writer().export_iric_result_csv(frames, output_dir)
         else:
-            with _resolve(input_path, opts.case_name) as cgn:
+            with _get_reader().resolve_case_cgn(input_path, opts.case_name) as cgn:
                 export_iric_like_csv(
                     cgn_path=cgn,
                     out_dir=output_dir,
@@ -214,6 +268,8 @@ def convert_iric_project(
                     fortran_order=opts.fortran_order,
                     location_preference=opts.location_preference,
                     include_flow_solution=opts.include_flow_solution,
+                    float_dtype=opts.float_dtype,
+                    workers=opts.workers,
                 )
     elif input_path.suffix.lower() == ".cgn":
         raise ValueError("CGNS 単体の入力はサポートしていません。プロジェクトフォルダを指定してください。")
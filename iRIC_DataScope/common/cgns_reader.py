@@ -1,12 +1,12 @@
 from __future__ import annotations
 
 import logging
-import re
-import shutil
 import tempfile
 import zipfile
-from contextlib import contextmanager
+from contextlib import contextmanager, nullcontext
 from dataclasses import dataclass
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
 from typing import Generator, Literal, Sequence
 
@@ -14,13 +14,27 @@ import h5py
 import numpy as np
 import pandas as pd
 
+from .iric_project import extract_zip_member, iter_matching_files
+
 logger = logging.getLogger(__name__)
 
 # CGNS/HDF5 ではノード直下の " data" に実配列が格納されていることが多い
 DATASET_NAME = " data"
 
+# HDF5 のチャンクキャッシュ（既定 1 MiB）では、チャンク化された大きな変数を読むたびに
+# 同じチャンクの読み直しが起きるため、格子 1 枚分程度が収まる大きさに広げておく。
+# キャッシュはデータセットごとに確保され、開いている間は保持されるため、これ以上は大きくせず、
+# 読み終えたデータセットはすぐに閉じる（iter_iric_step_frames 参照）。
+# page_buf_size はページ集約で作られたファイルでのみ有効で、それ以外では無視される。
+_H5_OPEN_KWARGS = {
+    "rdcc_nbytes": 64 * 1024 * 1024,
+    "rdcc_nslots": 10007,
+    "rdcc_w0": 0.75,
+    "page_buf_size": 16 * 1024 * 1024,
+}
+
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class IricStepFrame:
     """
     iRIC の Result_*.csv 相当の 1 ステップ分データ。
@@ -35,15 +49,31 @@ class IricStepFrame:
     df: pd.DataFrame
 
 
-def _decode_bytes(val) -> str:
+@lru_cache(maxsize=128)
+def _decode_scalar(val: bytes | str) -> str:
     if isinstance(val, bytes):
         try:
             return val.decode("ascii").strip()
         except Exception:
             return val.decode(errors="ignore").strip()
+    return str(val)
+
+
+@lru_cache(maxsize=128)
+def _decode_char_bytes(raw: bytes) -> str:
+    return raw.decode("ascii", errors="ignore").strip()
+
+
+def _decode_bytes(val) -> str:
+    if isinstance(val, (bytes, str)):
+        return _decode_scalar(val)
     if isinstance(val, np.ndarray):
         if val.dtype.kind in {"S", "U"}:
             return str(val[()]).strip().strip("b'").strip('"')
+        if val.ndim == 1 and val.dtype.itemsize == 1 and val.dtype.kind in "iu":
+            # CGNS の文字データ（int8 配列）は tolist() で 1 文字ずつ int にせず、そのままバイト列にする。
+            # 全ステップで同じ "Vertex" などが並ぶため、デコード結果はキャッシュする。
+            return _decode_char_bytes(val.tobytes())
         try:
             return bytes(val.tolist()).decode("ascii", errors="ignore").strip()
         except Exception:
@@ -51,52 +81,105 @@ def _decode_bytes(val) -> str:
     return str(val)
 
 
-def _normalize_location(loc: str | None) -> str | None:
+@lru_cache(maxsize=128)
+def _normalize_location_text(loc: bytes | str) -> str:
+    return _decode_scalar(loc).upper().replace(" ", "")
+
+
+def _normalize_location(loc) -> str | None:
+    # GridLocation は文字配列（int8）として格納されることが多いため、先に文字列へ戻す
+    if isinstance(loc, np.ndarray):
+        loc = _decode_bytes(loc)
     if not loc:
         return None
+    if isinstance(loc, (bytes, str)):
+        return _normalize_location_text(loc)
     return _decode_bytes(loc).upper().replace(" ", "")
 
 
-def _read_node_data(f: h5py.File, node_path: str) -> np.ndarray:
+def _read_node_data(f: h5py.File, node_path: str, *, mmap: bool = False) -> np.ndarray:
+    """
+    node_path 直下の " data" を読む。mmap=True なら、連続配置のデータセットは
+    コピーせず読み取り専用の np.memmap として返す（呼び出し側で参照を長く保持しないこと）。
+    """
     if node_path not in f:
         raise KeyError(f"{node_path} not found in CGNS")
     g = f[node_path]
     if DATASET_NAME not in g:
         raise KeyError(f"{node_path} has no '{DATASET_NAME}' dataset. keys={list(g.keys())}")
-    return np.asarray(g[DATASET_NAME][()])
+    ds = g[DATASET_NAME]
+    if mmap:
+        mapped = _try_mmap_dataset(ds)
+        if mapped is not None:
+            return mapped
+    return _read_into(ds)
 
 
-def _read_dataset_or_group(node: h5py.Group | h5py.Dataset) -> np.ndarray:
+def _read_into(ds: h5py.Dataset, out: np.ndarray | None = None) -> np.ndarray:
+    """
+    データセット全体を out（省略時は新規確保）へ read_direct で読み込んで返す。
+    ds[()] と違い、読み込み先を使い回せ、チャンク化されたデータでも汎用の選択処理を通らない。
+    数値以外（文字列など）や空・スカラーのデータセットは ds[()] で読む。
+    """
+    if ds.dtype.kind not in "biuf" or ds.size == 0 or ds.shape == ():
+        return np.asarray(ds[()])
+    if out is None:
+        out = np.empty(ds.shape, dtype=ds.dtype)
+    ds.read_direct(out)
+    return out
+
+
+def _try_mmap_dataset(ds: h5py.Dataset) -> np.ndarray | None:
+    # チャンク化・圧縮されたもの、既定ドライバ以外で開いたファイルは対象外
+    if ds.chunks is not None or ds.size == 0 or ds.file.driver != "sec2":
+        return None
+    try:
+        offset = ds.id.get_offset()
+    except Exception:
+        return None
+    if offset is None:
+        return None
+    try:
+        return np.memmap(ds.file.filename, mode="r", dtype=ds.dtype, shape=ds.shape, offset=offset)
+    except (OSError, ValueError) as e:
+        logger.debug("mmap failed for %s: %s", ds.name, e)
+        return None
+
+
+def _dataset_of(node: h5py.Group | h5py.Dataset) -> h5py.Dataset:
     if isinstance(node, h5py.Dataset):
-        return np.asarray(node[()])
+        return node
     if isinstance(node, h5py.Group):
         if DATASET_NAME not in node:
             raise KeyError(f"missing '{DATASET_NAME}' in group: {node.name}")
-        return np.asarray(node[DATASET_NAME][()])
+        return node[DATASET_NAME]
     raise TypeError(f"unsupported node type: {type(node)}")
 
 
-def _find_group_paths_by_name(f: h5py.File, target: str) -> list[str]:
-    hits: list[str] = []
-
-    def visitor(name, obj):
-        if isinstance(obj, h5py.Group) and Path(name).name == target:
-            hits.append(name)
-
-    f.visititems(visitor)
-    return hits
+def _read_dataset_or_group(node: h5py.Group | h5py.Dataset, out: np.ndarray | None = None) -> np.ndarray:
+    return _read_into(_dataset_of(node), out)
 
 
 def try_read_timevalues(f: h5py.File, zone_path: str) -> np.ndarray | None:
     base = zone_path.strip("/").split("/")[0]
-    cand = f"{base}/BaseIterativeData/TimeValues"
-    if cand in f:
-        return np.asarray(f[cand][DATASET_NAME][()])
-
-    hits = _find_group_paths_by_name(f, "TimeValues")
-    for p in hits:
-        if "BaseIterativeData" in p and p in f and DATASET_NAME in f[p]:
-            return np.asarray(f[p][DATASET_NAME][()])
+    ds = f.get(f"{base}/BaseIterativeData/TimeValues/{DATASET_NAME}")
+    if ds is not None:
+        return _read_into(ds)
+
+    # BaseIterativeData_t は CGNSBase の直下にしか置かれないため、ファイル全体は走査せず
+    # 各ベースの直下（自ベースを先に）で *IterativeData という名前のグループだけを確認する。
+    # Zone 配下（FlowSolution など）には降りない。
+    bases = [base] + [name for name in f if name != base]
+    for name in bases:
+        grp = f.get(name)
+        if not isinstance(grp, h5py.Group):
+            continue
+        for child in grp:
+            if not child.endswith("IterativeData"):
+                continue
+            ds = grp.get(f"{child}/TimeValues/{DATASET_NAME}")
+            if isinstance(ds, h5py.Dataset):
+                return _read_into(ds)
     return None
 
 
@@ -104,11 +187,12 @@ def _decode_flow_solution_pointers_int8(a: np.ndarray) -> list[str]:
     a = np.asarray(a)
     if a.dtype != np.int8 or a.ndim != 2:
         raise TypeError(f"unexpected pointers array: shape={a.shape}, dtype={a.dtype}")
-    out: list[str] = []
-    for row in a:
-        s = bytes(row.tolist()).decode("ascii", errors="ignore")
-        out.append(s.replace("\x00", "").strip())
-    return out
+    if a.shape[1] == 0:
+        # 幅 0 の "S0" には view できない
+        return [""] * a.shape[0]
+    # 各行を固定長のバイト列として一括で解釈し、行ごとの tolist()/bytes() 生成を避ける
+    raw = np.ascontiguousarray(a).view(f"S{a.shape[1]}").reshape(-1)
+    return [b.replace(b"\x00", b"").decode("ascii", errors="ignore").strip() for b in raw.tolist()]
 
 
 def _grid_location(sol_group: h5py.Group) -> str | None:
@@ -128,7 +212,11 @@ def _load_flow_solutions(
     zone_path: str,
     *,
     grid_location: Literal["node", "cell"] = "node",
-) -> tuple[list[str], list[str | None], set[str]]:
+) -> tuple[list[str], list[str | None], set[str], list[h5py.Group | None]]:
+    """
+    各ステップの FlowSolution 名・GridLocation と、解決済みのグループを返す。
+    グループはステップ読み込み時にパスを引き直さないよう、ここで一度だけ解決する。
+    """
     pointers: list[str] = []
     if grid_location == "node":
         pointers_path = f"{zone_path}/ZoneIterativeData/FlowSolutionPointers"
@@ -144,15 +232,23 @@ def _load_flow_solutions(
 
     locations: list[str | None] = []
     location_set: set[str] = set()
+    groups: list[h5py.Group | None] = []
     for name in pointers:
-        sol_path = f"{zone_path}/{name}"
-        loc = _grid_location(f[sol_path]) if sol_path in f else None
+        sol_group = f.get(f"{zone_path}/{name}")
+        groups.append(sol_group)
+        loc = _grid_location(sol_group) if sol_group is not None else None
         norm = _normalize_location(loc)
         locations.append(norm)
         if norm:
             location_set.add(norm)
 
-    return pointers, locations, location_set
+    return pointers, locations, location_set, groups
+
+
+def count_flow_solutions(cgn_path: Path, zone_path: str = "iRIC/iRICZone") -> int:
+    """CGNS のステップ数（FlowSolution の数）を返す。座標や変数の値は読まない。"""
+    with open_cgns(cgn_path) as f:
+        return len(_load_flow_solutions(f, zone_path.strip("/"))[0])
 
 
 def _list_flow_solution_groups(f: h5py.File, zone_path: str) -> list[str]:
@@ -163,24 +259,82 @@ def _list_flow_cell_solution_groups(f: h5py.File, zone_path: str) -> list[str]:
     return _list_solution_groups(f, zone_path, prefix="flowcellsolution")
 
 
+def _solution_sort_key(name: str) -> tuple[int, int | str]:
+    # 末尾の数字（FlowSolution12 の 12）で並べ、数字が無いものは名前順で後ろに置く
+    i = len(name)
+    while i and name[i - 1].isdecimal():
+        i -= 1
+    if i < len(name):
+        return (0, int(name[i:]))
+    return (1, name.lower())
+
+
 def _list_solution_groups(f: h5py.File, zone_path: str, *, prefix: str) -> list[str]:
-    if zone_path not in f:
-        return []
-    zone = f[zone_path]
-    names: list[str] = []
-    for name, obj in zone.items():
-        if isinstance(obj, h5py.Group) and name.lower().startswith(prefix):
-            names.append(name)
-    if not names:
+    zone = f.get(zone_path)
+    if not isinstance(zone, h5py.Group):
         return []
+    # 名前で絞り込んでから種別を確認し、対象外のノードはオブジェクトとして開かない
+    names = [
+        name
+        for name in zone
+        if name.lower().startswith(prefix) and zone.get(name, getclass=True) is h5py.Group
+    ]
+    names.sort(key=_solution_sort_key)
+    return names
+
+
+def _target_dtype(dtype: np.dtype, float_dtype: str | None) -> np.dtype:
+    """float_dtype 指定時、浮動小数の型だけをその型に置き換える。"""
+    if float_dtype is None or dtype.kind != "f":
+        return dtype
+    return np.dtype(float_dtype)
+
+
+def _cast_float(a: np.ndarray, float_dtype: str | None) -> np.ndarray:
+    return a.astype(_target_dtype(a.dtype, float_dtype), copy=False)
+
 
-    def sort_key(n: str):
-        m = re.search(r"(\d+)$", n)
-        if m:
-            return (0, int(m.group(1)))
-        return (1, n.lower())
+def _flatten(a: np.ndarray, order: Literal["F", "C"], float_dtype: str | None) -> np.ndarray:
+    """a を order の順で 1 次元化する。型変換が必要な場合も、並べ替えと合わせてコピーは 1 回で済ませる。"""
+    dtype = _target_dtype(a.dtype, float_dtype)
+    if order == "F":
+        # a の Fortran 順は a.T の C 順と同じ
+        return a.T.astype(dtype, order="C").reshape(-1)
+    return a.astype(dtype, copy=False).reshape(-1)
 
-    return sorted(names, key=sort_key)
+
+def _select_step_datasets(
+    sol_group: h5py.Group, vars_selected: Sequence[str], grid_shape: tuple[int, ...]
+) -> list[tuple[str, h5py.h5d.DatasetID]]:
+    """
+    sol_group から出力対象の変数を選び、(変数名, 低水準の DatasetID) を返す。
+    ステップのループでは DatasetID.read で直接読み、Dataset 経由の選択処理を毎回通さない。
+    """
+    selected: list[tuple[str, h5py.h5d.DatasetID]] = []
+    for v in vars_selected:
+        node = sol_group.get(v)
+        if node is None:
+            continue
+        try:
+            ds = _dataset_of(node)
+        except Exception as ex:
+            logger.debug("Skip var %s: read error: %s", v, ex)
+            continue
+        if ds.shape != grid_shape:
+            logger.debug("Skip var %s: shape %s != %s", v, ds.shape, grid_shape)
+            continue
+        if ds.dtype.kind not in "biuf":
+            logger.debug("Skip var %s: non-numeric dtype %s", v, ds.dtype)
+            continue
+        selected.append((v, ds.id))
+    return selected
+
+
+def _detach(a: np.ndarray, source: np.ndarray) -> np.ndarray:
+    """a が source（メモリマップの可能性あり）を参照していれば通常の配列にコピーする。"""
+    if isinstance(source, np.memmap) and np.may_share_memory(a, source):
+        return np.array(a)
+    return a
 
 
 def _compute_cell_centers(a: np.ndarray) -> np.ndarray:
@@ -188,53 +342,57 @@ def _compute_cell_centers(a: np.ndarray) -> np.ndarray:
         raise RuntimeError(f"Expected 2D grid for cell-center conversion, got shape={a.shape}")
     if a.shape[0] < 2 or a.shape[1] < 2:
         raise RuntimeError(f"Grid is too small for cell-center conversion: shape={a.shape}")
-    return 0.25 * (a[:-1, :-1] + a[:-1, 1:] + a[1:, :-1] + a[1:, 1:])
+    if a.dtype.kind != "f":
+        a = a.astype(np.float64)
+    # 4 点の和は 1 つの配列に順に足し込み、格子サイズの一時配列を作らない
+    out = a[:-1, :-1] + a[:-1, 1:]
+    out += a[1:, :-1]
+    out += a[1:, 1:]
+    out *= 0.25
+    return out
+
+
+_VERTEX_LABELS = frozenset({"VERTEX", "NODE", "NODAL"})
+_CELL_LABELS = frozenset({"CELLCENTER", "CELL_CENTER"})
+# location_preference -> 探す順の GridLocation ラベル群（"auto" は Vertex 優先）
+_LOCATION_ORDER = {
+    "vertex": (_VERTEX_LABELS, _CELL_LABELS),
+    "cell": (_CELL_LABELS, _VERTEX_LABELS),
+    "auto": (_VERTEX_LABELS, _CELL_LABELS),
+}
 
 
 def _pick_preferred_location(
     available: set[str], preference: Literal["auto", "vertex", "cell"]
 ) -> str | None:
-    vertex_labels = {"VERTEX", "NODE", "NODAL"}
-    cell_labels = {"CELLCENTER", "CELL_CENTER"}
-
-    if preference == "vertex":
-        if available & vertex_labels:
-            return next(iter(vertex_labels & available))
-        if available & cell_labels:
-            return next(iter(cell_labels & available))
-        return None
-
-    if preference == "cell":
-        if available & cell_labels:
-            return next(iter(cell_labels & available))
-        if available & vertex_labels:
-            return next(iter(vertex_labels & available))
-        return None
-
-    if available & vertex_labels:
-        return next(iter(vertex_labels & available))
-    if available & cell_labels:
-        return next(iter(cell_labels & available))
+    for labels in _LOCATION_ORDER.get(preference, _LOCATION_ORDER["auto"]):
+        hit = labels & available
+        if hit:
+            return next(iter(hit))
     return None
 
 
 def _pick_cgn_from_ipro(z: zipfile.ZipFile, case_name: str) -> str:
-    names = z.namelist()
-
-    for n in names:
-        if Path(n).name.lower() == case_name.lower():
-            return n
+    # 通常の .ipro では直下に置かれているため、まず中央ディレクトリの辞書を直接引く
+    for candidate in (case_name, f"./{case_name}"):
+        try:
+            return z.getinfo(candidate).filename
+        except KeyError:
+            pass
 
-    cgns = [n for n in names if n.lower().endswith(".cgn")]
-    if len(cgns) == 1:
-        return cgns[0]
+    case_lower = case_name.lower()
+    cgns: list[zipfile.ZipInfo] = []
+    for info in z.infolist():
+        name = info.filename
+        # zip 内のパス区切りは常に "/" なので、メンバーごとに Path を作らず文字列で末尾を取る
+        if name.rsplit("/", 1)[-1].lower() == case_lower:
+            return name
+        if name.lower().endswith(".cgn"):
+            cgns.append(info)
 
     if cgns:
-        size_map = {}
-        for info in z.infolist():
-            if info.filename in cgns:
-                size_map[info.filename] = info.file_size
-        return max(size_map, key=size_map.get)
+        # 複数ある場合は最も大きいもの（同じ大きさなら先に現れたもの）
+        return max(cgns, key=lambda info: info.file_size).filename
 
     raise FileNotFoundError("No .cgn found in .ipro")
 
@@ -250,11 +408,16 @@ def resolve_case_cgn(input_path: Path, case_name: str) -> Generator[Path, None,
     p = input_path
 
     if p.is_dir():
-        hit = list(p.rglob(case_name))
-        if hit:
-            yield hit[0]
+        # 直下にあれば配下の走査は不要。無ければ最初に見つかった時点で打ち切る
+        direct = p / case_name
+        if direct.is_file():
+            yield direct
             return
-        cgns = list(p.rglob("*.cgn"))
+        hit = next(iter_matching_files(p, case_name), None)
+        if hit is not None:
+            yield hit
+            return
+        cgns = list(islice(iter_matching_files(p, "*.cgn"), 2))
         if len(cgns) == 1:
             yield cgns[0]
             return
@@ -269,17 +432,20 @@ def resolve_case_cgn(input_path: Path, case_name: str) -> Generator[Path, None,
             td_path = Path(td)
             with zipfile.ZipFile(p, "r") as z:
                 target = _pick_cgn_from_ipro(z, case_name)
-                out = td_path / Path(target).name
-                with z.open(target) as src, out.open("wb") as dst:
-                    shutil.copyfileobj(src, dst)
+                out = extract_zip_member(z, target, td_path / Path(target).name)
             yield out
         return
 
     raise ValueError(f"Unsupported input: {p} (expected .cgn, .ipro, or directory)")
 
 
+def open_cgns(cgn_path: Path) -> h5py.File:
+    """CGNS を読み取り専用で開く（チャンクキャッシュ等は _H5_OPEN_KWARGS の設定を使う）。"""
+    return h5py.File(cgn_path, "r", **_H5_OPEN_KWARGS)
+
+
 def iter_iric_step_frames(
-    cgn_path: Path,
+    cgn_path: Path | h5py.File,
     *,
     zone_path: str = "iRIC/iRICZone",
     grid_location: Literal["node", "cell"] = "node",
@@ -290,15 +456,22 @@ def iter_iric_step_frames(
     fortran_order: bool = True,
     location_preference: Literal["auto", "vertex", "cell"] = "auto",
     include_flow_solution: bool = True,
+    float_dtype: str | None = None,
 ) -> Generator[IricStepFrame, None, None]:
     """
     CGNS を読み込み、iRIC 互換 CSV 相当の DataFrame をステップ単位で返す。
+
+    float_dtype を指定すると（例: "float32"）、座標と浮動小数の変数をその型に変換する。
+    None の場合は CGNS に格納された型のまま返す。
+    cgn_path に開いた h5py.File を渡した場合はそれを使い、閉じずに返す。
     """
     zone_path = zone_path.strip("/")
 
-    with h5py.File(cgn_path, "r") as f:
-        x = _read_node_data(f, f"{zone_path}/GridCoordinates/CoordinateX")
-        y = _read_node_data(f, f"{zone_path}/GridCoordinates/CoordinateY")
+    opened = nullcontext(cgn_path) if isinstance(cgn_path, h5py.File) else open_cgns(cgn_path)
+    with opened as f:
+        # 座標は 1 次元化の際にコピーされるため、読み込み自体はメモリマップで済ませる
+        x = _cast_float(_read_node_data(f, f"{zone_path}/GridCoordinates/CoordinateX", mmap=True), float_dtype)
+        y = _cast_float(_read_node_data(f, f"{zone_path}/GridCoordinates/CoordinateY", mmap=True), float_dtype)
         if x.shape != y.shape:
             raise RuntimeError(f"CoordinateX shape {x.shape} != CoordinateY shape {y.shape}")
 
@@ -309,19 +482,33 @@ def iter_iric_step_frames(
             grid_x = x
             grid_y = y
 
-        order = "F" if fortran_order else "C"
-        ii, jj = np.indices(grid_x.shape)
+        order: Literal["F", "C"] = "F" if fortran_order else "C"
+        # np.indices で格子全体の添字配列を 2 枚作らず、1 次元の連番から直接並べる
+        ni, nj = grid_x.shape
+        i_idx = np.arange(1, ni + 1, dtype=np.int32)
+        j_idx = np.arange(1, nj + 1, dtype=np.int32)
+        if fortran_order:
+            i_col, j_col = np.tile(i_idx, nj), np.repeat(j_idx, ni)
+        else:
+            i_col, j_col = np.repeat(i_idx, nj), np.tile(j_idx, ni)
         base_cols = {
-            "I": (ii + 1).ravel(order=order),
-            "J": (jj + 1).ravel(order=order),
-            "X": grid_x.ravel(order=order),
-            "Y": grid_y.ravel(order=order),
+            "I": i_col,
+            "J": j_col,
+            "X": _detach(grid_x.ravel(order=order), x),
+            "Y": _detach(grid_y.ravel(order=order), y),
         }
+        # 座標列は全ステップの DataFrame で共有するため、誤って書き換えられないよう読み取り専用にする
+        for col in base_cols.values():
+            col.flags.writeable = False
+        # メモリマップはここで手放す（Windows では開いたままだと一時ファイルを削除できない）
+        grid_shape = grid_x.shape
+        del x, y, grid_x, grid_y
 
-        time_values = try_read_timevalues(f, zone_path)
+        # 時刻は FlowSolution を出力する場合しか使わない
+        time_values = try_read_timevalues(f, zone_path) if include_flow_solution else None
 
         if include_flow_solution:
-            sol_names, sol_locations, location_set = _load_flow_solutions(
+            sol_names, sol_locations, location_set, sol_groups = _load_flow_solutions(
                 f,
                 zone_path,
                 grid_location=grid_location,
@@ -334,16 +521,16 @@ def iter_iric_step_frames(
             if nstep < 1:
                 raise RuntimeError("No FlowSolution found")
 
-            first_sol_path = f"{zone_path}/{sol_names[0]}"
-            if first_sol_path not in f:
-                raise FileNotFoundError(f"{first_sol_path} not found in CGNS")
-            var_all = [k for k in f[first_sol_path].keys() if k != "GridLocation"]
+            if sol_groups[0] is None:
+                raise FileNotFoundError(f"{zone_path}/{sol_names[0]} not found in CGNS")
+            var_all = [k for k in sol_groups[0].keys() if k != "GridLocation"]
             vars_selected: Sequence[str] = (
                 [v for v in vars_keep if v in var_all] if vars_keep else var_all
             )
         else:
             sol_names = []
             sol_locations = []
+            sol_groups = []
             preferred = None
             nstep = 1
             vars_selected = []
@@ -353,42 +540,59 @@ def iter_iric_step_frames(
         step_from = max(1, step_from)
         step_to = min(nstep, step_to)
 
-        for step in range(step_from, step_to + 1, step_skip):
+        steps = range(step_from, step_to + 1, step_skip)
+
+        # Fortran 順の 1 次元化は必ずコピーになるため、その読み込み先は変数ごとに使い回す。
+        # C 順では読み込んだ配列をそのまま列にするので、ステップごとに新しく確保する。
+        # float_dtype の変換は読み込み時に HDF5 に任せ、変換用の一時配列を作らない。
+        buffers: dict[str, np.ndarray] = {}
+
+        def read_step_columns(sol_group: h5py.Group) -> dict[str, np.ndarray]:
+            # データセットはこのステップを読む直前に開き、この関数を抜けた時点で手放して閉じる。
+            # 全ステップ分を先に開いておくと、チャンク化・圧縮された変数ではキャッシュ等のメモリが
+            # ステップ数に比例して増え、最初のステップを返すまでの時間も延びる。
+            out: dict[str, np.ndarray] = {}
+            for v, dsid in _select_step_datasets(sol_group, vars_selected, grid_shape):
+                # 読み込み先は必ずデータセットと同じ形状で確保する（DatasetID.read は形状を検査しない）
+                dtype = _target_dtype(dsid.dtype, float_dtype)
+                if fortran_order:
+                    buf = buffers.get(v)
+                    if buf is None or buf.dtype != dtype:
+                        buf = buffers[v] = np.empty(dsid.shape, dtype=dtype)
+                else:
+                    buf = np.empty(dsid.shape, dtype=dtype)
+                try:
+                    dsid.read(h5py.h5s.ALL, h5py.h5s.ALL, buf)
+                except Exception as ex:
+                    logger.debug("Skip var %s: read error: %s", v, ex)
+                    continue
+                out[v] = _flatten(buf, order, float_dtype)
+            return out
+
+        for step in steps:
             cols = dict(base_cols)
             loc_norm: str | None = None
 
             if include_flow_solution:
-                sol_name = sol_names[step - 1]
-                sol_path = f"{zone_path}/{sol_name}"
-                if sol_path not in f:
-                    raise FileNotFoundError(f"{sol_path} not found in CGNS")
+                sol_group = sol_groups[step - 1]
+                if sol_group is None:
+                    raise FileNotFoundError(f"{zone_path}/{sol_names[step - 1]} not found in CGNS")
 
                 loc_norm = _normalize_location(sol_locations[step - 1])
-                sol_group = f[sol_path]
-
-                for v in vars_selected:
-                    if v not in sol_group:
-                        continue
-                    try:
-                        arr = _read_dataset_or_group(sol_group[v])
-                    except Exception as ex:
-                        logger.debug("Skip var %s: read error: %s", v, ex)
-                        continue
-
-                    if arr.shape != grid_x.shape:
-                        logger.debug("Skip var %s: shape %s != %s", v, arr.shape, grid_x.shape)
-                        continue
-                    cols[v] = arr.ravel(order=order)
+
+                cols.update(read_step_columns(sol_group))
 
             t_val = 0.0
-            if include_flow_solution and time_values is not None and len(time_values) >= step:
+            if time_values is not None and len(time_values) >= step:
                 try:
                     t_val = float(time_values[step - 1])
                 except Exception:
                     t_val = 0.0
 
-            df = pd.DataFrame(cols)
-            imax, jmax = grid_x.shape
+            # 各列は座標列（読み取り専用で共有）かこのステップ専用の配列なので、
+            # コピーも 2 次元ブロックへの統合もせずにそのまま DataFrame の列にする
+            df = pd.DataFrame(cols, copy=False)
+            imax, jmax = grid_shape
             yield IricStepFrame(
                 step=step,
                 time=t_val,
@@ -1,7 +1,10 @@
 import os
-import glob
+
 import pandas as pd
 
+from .iric_project import iter_matching_files
+
+
 def list_csv_files(csv_dir: str) -> list[str]:
     """
     指定されたフォルダ以下を再帰的に探索し、
@@ -23,14 +26,18 @@ def list_csv_files(csv_dir: str) -> list[str]:
         raise NotADirectoryError(f"指定パスがディレクトリではありません: {csv_dir}")
 
     # 2. 再帰的に Result_*.csv を検索
-    pattern = os.path.join(csv_dir, '**', '*.csv')
-    files = glob.glob(pattern, recursive=True)
+    # glob.glob(..., recursive=True) と同じく、"." で始まる名前は除き、フォルダのリンクはたどる
+    files = [
+        os.fspath(p)
+        for p in iter_matching_files(csv_dir, "*.csv", skip_hidden=True, follow_symlinks=True)
+    ]
 
     # 3. 見つからなければ明示的に例外
     if not files:
         raise FileNotFoundError(f"{csv_dir} 以下に CSVファイル が見つかりません")
 
-    return sorted(files)
+    files.sort()
+    return files
 
 
 def read_iric_csv(csv_path: str) -> tuple[float, pd.DataFrame]:
@@ -40,12 +47,13 @@ def read_iric_csv(csv_path: str) -> tuple[float, pd.DataFrame]:
     ・2 行目以降を DataFrame にロード
     をタプルで返す
     """
-    with open(csv_path, 'r', encoding='utf-8') as f:
-        first = f.readline().strip()
-    try:
-        time = float(first.split('=')[1].strip())
-    except Exception as e:
-        raise ValueError(f"時刻取得エラー: {first}") from e
-
-    df = pd.read_csv(csv_path, skiprows=2)
+    # ファイルは 1 回だけ開き、先頭 2 行を読んだ位置から続けて pandas に渡す
+    with open(csv_path, 'rb') as f:
+        first = f.readline().decode('utf-8-sig', errors='replace').strip()
+        try:
+            time = float(first.split('=')[1].strip())
+        except Exception as e:
+            raise ValueError(f"時刻取得エラー: {first}") from e
+        f.readline()
+        df = pd.read_csv(f)
     return time, df
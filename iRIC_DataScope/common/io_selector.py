@@ -63,7 +63,7 @@ class IOFolderSelector(ttk.Frame):
 
     def get_input_dir(self) -> Path:
         """選択された入力 Path を返す（フォルダ or .ipro or .cgn）"""
-        return Path(self.input_selector.get_path())
+        return self.input_selector.get_path()
 
     def get_output_dir(self) -> Path:
         """選択された出力フォルダの Path を返す"""
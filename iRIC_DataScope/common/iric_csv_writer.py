@@ -1,9 +1,32 @@
 from __future__ import annotations
 
+import os
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 
+import numpy as np
+import pandas as pd
+
 from .cgns_reader import IricStepFrame
 
+# 高速経路で一度に文字列化する行数（文字列リストのメモリを抑えるため分割する）
+_CHUNK_ROWS = 65536
+# ヘッダーにこれらが含まれると pandas は列名をクォートするため、高速経路を使わない
+_QUOTE_CHARS = frozenset(',"\r\n')
+# Result_*.csv の書き込みバッファ（既定の 8 KiB では大きな格子で write が細切れになる）
+_WRITE_BUFSIZE = 4 * 1024 * 1024
+# 書き出し待ちにしておけるステップ数（読み込みと書き出しを重ねつつ、保持する DataFrame を抑える）
+_MAX_PENDING_WRITES = 2
+# 全ステップで共通になる座標列。行頭部分の文字列は export_iric_result_csv の中で使い回す
+_BASE_COLUMNS = ("I", "J", "X", "Y")
+
+# Result_*.csv 先頭の 2 行（時刻と格子サイズ）。まとめて 1 回で書き込む
+_HEADER_TEMPLATE = "iRIC output t = {t}\n{imax},{jmax}\n"
+
+# 座標列名 -> (座標列の配列, 文字列化済みの行頭 "I,J,X,Y")
+_PrefixCache = dict[tuple[str, ...], tuple[list[np.ndarray], list[str]]]
+
 
 def format_iric_time(t) -> str:
     try:
@@ -15,17 +38,107 @@ def format_iric_time(t) -> str:
         return str(t)
 
 
-def write_iric_result_csv(frame: IricStepFrame, out_path: Path) -> None:
+def _plain_columns(df: pd.DataFrame) -> list[np.ndarray] | None:
+    """
+    pandas.to_csv と同じ表記で文字列化できる列（整数 / float32 / float64）だけなら各列の配列を返す。
+    それ以外（object・クォートが必要な列名など）は None。
+    """
+    # 1 列のみの場合、pandas は欠損を '""' と書くため対象外にする
+    if df.empty or df.shape[1] < 2:
+        return None
+    columns: list[np.ndarray] = []
+    for name, series in df.items():
+        if not isinstance(name, str) or not _QUOTE_CHARS.isdisjoint(name):
+            return None
+        values = series.to_numpy()
+        if values.dtype.kind not in "iu" and values.dtype not in (np.float32, np.float64):
+            return None
+        columns.append(values)
+    return columns
+
+
+def _format_column(values: np.ndarray) -> list[str]:
+    if values.dtype == np.float32:
+        # tolist() は float64 に広げて桁が増えるため、float32 の最短表記で文字列化する
+        texts = values.astype(str).tolist()
+    else:
+        texts = list(map(str, values.tolist()))
+    if values.dtype.kind == "f":
+        # pandas は NaN を空欄で出力する
+        for i in np.flatnonzero(np.isnan(values)).tolist():
+            texts[i] = ""
+    return texts
+
+
+def _base_row_prefixes(
+    names: list[str], columns: list[np.ndarray], cache: _PrefixCache | None
+) -> tuple[int, list[str] | None]:
+    """先頭の座標列を文字列化した行頭を返す。前ステップと同じ座標ならキャッシュを使う。"""
+    n = 0
+    while n < min(len(names), len(_BASE_COLUMNS)) and names[n] == _BASE_COLUMNS[n]:
+        n += 1
+    if cache is None or n == 0:
+        return 0, None
+    key = tuple(names[:n])
+    base = columns[:n]
+    cached = cache.get(key)
+    if cached is not None and all(np.array_equal(a, b) for a, b in zip(cached[0], base)):
+        return n, cached[1]
+    prefixes = list(map(",".join, zip(*(_format_column(values) for values in base))))
+    cache.clear()
+    cache[key] = (base, prefixes)
+    return n, prefixes
+
+
+def _write_csv_body(df: pd.DataFrame, fp, prefix_cache: _PrefixCache | None = None) -> None:
+    """
+    df をヘッダー付き CSV として fp に書き出す（df.to_csv(fp, index=False) と同じ内容）。
+
+    to_csv は値の文字列化が行単位の Python 処理になるため、数値列だけの場合は
+    列ごとに tolist() + str でまとめて変換し、行を結合して書き出す。
+    （np.savetxt も行ごとの % 書式で速度は同程度で、"%.7g" などでは桁が落ちて出力が変わるため使わない。
+    pyarrow の CSV 出力は依存に含まれず、1.0 を "1" と書くなど数値の表記も pandas と異なる）
+    prefix_cache を渡すと、座標列（I,J,X,Y）の文字列化をステップ間で共有する。
+    """
+    columns = _plain_columns(df)
+    if columns is None:
+        df.to_csv(fp, index=False)
+        return
+    names = list(df.columns)
+    n_base, prefixes = _base_row_prefixes(names, columns, prefix_cache)
+    sep = os.linesep
+    fp.write(",".join(names) + sep)
+    for start in range(0, len(df), _CHUNK_ROWS):
+        stop = start + _CHUNK_ROWS
+        texts = [_format_column(values[start:stop]) for values in columns[n_base:]]
+        if prefixes is not None:
+            texts.insert(0, prefixes[start:stop])
+        fp.write(sep.join(map(",".join, zip(*texts))))
+        fp.write(sep)
+
+
+def write_iric_result_csv(
+    frame: IricStepFrame, out_path: Path, *, prefix_cache: _PrefixCache | None = None
+) -> None:
     out_path.parent.mkdir(parents=True, exist_ok=True)
-    with out_path.open("w", encoding="utf-8-sig", newline="") as fp:
-        fp.write(f"iRIC output t = {format_iric_time(frame.time)}\n")
-        fp.write(f"{frame.imax},{frame.jmax}\n")
-        frame.df.to_csv(fp, index=False)
+    with out_path.open("w", encoding="utf-8-sig", newline="", buffering=_WRITE_BUFSIZE) as fp:
+        fp.write(_HEADER_TEMPLATE.format(t=format_iric_time(frame.time), imax=frame.imax, jmax=frame.jmax))
+        _write_csv_body(frame.df, fp, prefix_cache)
 
 
 def export_iric_result_csv(frames, out_dir: Path, filename_template: str = "Result_{step}.csv") -> None:
     out_dir.mkdir(parents=True, exist_ok=True)
-    for frame in frames:
-        out_path = out_dir / filename_template.format(step=frame.step)
-        write_iric_result_csv(frame, out_path)
+    # 格子は通常全ステップで同じなので、座標列の文字列化は最初のステップだけで済ませる
+    prefix_cache: _PrefixCache = {}
+    pending: deque[Future] = deque()
+    # 次のステップの読み込み（frames の生成）と前のステップの書き出しを重ねる。
+    # prefix_cache を共有するため、書き出しスレッドは 1 本に限る。
+    with ThreadPoolExecutor(max_workers=1, thread_name_prefix="iric-csv-writer") as ex:
+        for frame in frames:
+            if len(pending) >= _MAX_PENDING_WRITES:
+                pending.popleft().result()
+            out_path = out_dir / filename_template.format(step=frame.step)
+            pending.append(ex.submit(write_iric_result_csv, frame, out_path, prefix_cache=prefix_cache))
+        while pending:
+            pending.popleft().result()
 
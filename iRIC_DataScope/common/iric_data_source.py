@@ -1,19 +1,26 @@
 from __future__ import annotations
 
 import logging
+import os
+import queue
 import re
 import shutil
 import tempfile
-import zipfile
-from dataclasses import dataclass
+import threading
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import nullcontext
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Iterable, Literal, TYPE_CHECKING
+from typing import Callable, Iterable, Iterator, Literal, TypeVar, TYPE_CHECKING
 
 import pandas as pd
 
 from iRIC_DataScope.common.iric_project import (
     classify_input_dir,
     discover_project_cgns,
+    extract_zip_members,
+    iter_matching_files,
     list_solution_cgns_in_dir,
     list_solution_cgns_in_ipro,
     parse_solution_step,
@@ -24,19 +31,118 @@ logger = logging.getLogger(__name__)
 if TYPE_CHECKING:
     from iRIC_DataScope.common.cgns_reader import IricStepFrame
 
+_T = TypeVar("_T")
+_R = TypeVar("_R")
+
+# iter_frames で先読みしておくステップ数（保持する DataFrame の数を抑える）
+_PREFETCH_FRAMES = 2
+# Result_*.csv を並列に解析するスレッド数の上限（pandas の C パーサは解析中に GIL を解放する）
+_CSV_READ_WORKERS = 4
+# DataSource が開いたままにしておく CGNS の数（series では古いものから閉じる）
+_H5_CACHE_SIZE = 4
+
+
+def _prefetch(items: Iterable[_T], maxsize: int = _PREFETCH_FRAMES) -> Iterator[_T]:
+    """
+    items を別スレッドで先読みしながら順に返す。
+    次のステップの読み込み（HDF5 / CSV の解析）と、呼び出し側の処理を重ねるために使う。
+    途中で打ち切られた場合も、読み込み側（開いているファイル）を閉じてから戻る。
+    """
+    q: queue.Queue = queue.Queue(maxsize=maxsize)
+    stop = threading.Event()
+    end = object()
+
+    def put(entry) -> bool:
+        while not stop.is_set():
+            try:
+                q.put(entry, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def produce() -> None:
+        it = iter(items)
+        try:
+            for item in it:
+                if not put((item, None)):
+                    return
+            put((end, None))
+        except BaseException as exc:
+            put((end, exc))
+        finally:
+            close = getattr(it, "close", None)
+            if close is not None:
+                close()
+
+    worker = threading.Thread(target=produce, name="iric-frame-prefetch", daemon=True)
+    worker.start()
+    try:
+        while True:
+            item, exc = q.get()
+            if item is end:
+                if exc is not None:
+                    raise exc
+                return
+            yield item
+    finally:
+        stop.set()
+        worker.join()
+
+
+def _map_ordered(fn: Callable[[_T], _R], items: Iterable[_T], workers: int) -> Iterator[_R]:
+    """
+    items の各要素に fn を適用した結果を items の順に返す。
+    workers > 1 の場合はスレッドで最大 workers 個先まで並列に処理する（保持する結果もその数まで）。
+    """
+    if workers <= 1:
+        for item in items:
+            yield fn(item)
+        return
+    it = iter(items)
+    pending: deque[Future] = deque()
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="iric-csv-read") as ex:
+        try:
+            for item in it:
+                pending.append(ex.submit(fn, item))
+                if len(pending) >= workers:
+                    break
+            while pending:
+                result = pending.popleft().result()
+                for item in it:
+                    pending.append(ex.submit(fn, item))
+                    break
+                yield result
+        finally:
+            # 途中で打ち切られた場合、まだ始まっていない読み込みは取り消す
+            for fut in pending:
+                fut.cancel()
+
+
+def _index_steps(steps: list[int]) -> dict[int, int]:
+    # 同じ step が複数ある場合は、list.index と同じく先頭の位置を使う
+    index: dict[int, int] = {}
+    for i, step in enumerate(steps):
+        index.setdefault(step, i)
+    return index
+
 
 def _dedupe_columns(cols: list[str]) -> list[str]:
-    seen: set[str] = set()
-    out: list[str] = []
-    for c in cols:
-        if c and c not in seen:
-            out.append(c)
-            seen.add(c)
-    return out
+    # dict.fromkeys は順序を保ったまま重複を除く
+    return [c for c in dict.fromkeys(cols) if c]
+
+
+# Result_*.csv の座標列（値の列一覧からは除く）
+_CSV_INDEX_COLS = frozenset({"I", "J", "X", "Y"})
+# 座標は常に浮動小数なので、型推定を飛ばして直接 float64 に変換させる
+_CSV_COORD_DTYPES = {"X": "float64", "Y": "float64"}
+
+
+_RE_RESULT_STEP = re.compile(r"Result_(\d+)", re.IGNORECASE)
 
 
 def _parse_step_number(path: Path) -> int | None:
-    m = re.search(r"Result_(\d+)", path.stem, flags=re.IGNORECASE)
+    m = _RE_RESULT_STEP.search(path.stem)
     if not m:
         return None
     try:
@@ -54,23 +160,21 @@ def _list_flow_cell_solution_names(f, zone_path: str) -> list[str]:
 
 
 def _list_solution_names_by_prefix(f, zone_path: str, *, prefix: str) -> list[str]:
-    if zone_path not in f:
-        return []
-    zone = f[zone_path]
-    names: list[str] = []
-    for name, obj in zone.items():
-        if hasattr(obj, "keys") and name.lower().startswith(prefix):
-            names.append(name)
-    if not names:
-        return []
+    # zone.items() は子ノードをすべてオブジェクトとして開くため、名前で絞り込む cgns_reader 側の実装を使う
+    from iRIC_DataScope.common.cgns_reader import _list_solution_groups
+
+    return _list_solution_groups(f, zone_path, prefix=prefix)
+
 
-    def sort_key(n: str):
-        m = re.search(r"(\d+)$", n)
-        if m:
-            return (0, int(m.group(1)))
-        return (1, n.lower())
+def _read_data_array(f, node_path: str):
+    """node_path 直下の " data" を、確保した配列へ read_direct で読み込む（h5py の中間配列を経由しない）。"""
+    import numpy as _np
 
-    return sorted(names, key=sort_key)
+    dset = f[node_path][" data"]
+    out = _np.empty(dset.shape, dtype=dset.dtype)
+    if out.size:
+        dset.read_direct(out)
+    return out
 
 
 def _compute_cell_centers(a):
@@ -81,46 +185,51 @@ def _compute_cell_centers(a):
         raise RuntimeError(f"Expected 2D grid for cell-center conversion, got shape={arr.shape}")
     if arr.shape[0] < 2 or arr.shape[1] < 2:
         raise RuntimeError(f"Grid is too small for cell-center conversion: shape={arr.shape}")
-    return 0.25 * (arr[:-1, :-1] + arr[:-1, 1:] + arr[1:, :-1] + arr[1:, 1:])
+    if arr.dtype.kind != "f":
+        arr = arr.astype(_np.float64)
+    # 4 点の和は 1 つの出力配列に順に足し込み、格子サイズの一時配列を作らない
+    out = _np.add(arr[:-1, :-1], arr[:-1, 1:])
+    _np.add(out, arr[1:, :-1], out=out)
+    _np.add(out, arr[1:, 1:], out=out)
+    out *= 0.25
+    return out
 
 
 def _list_result_csv_files(input_dir: Path) -> list[Path]:
-    files = sorted(input_dir.rglob("Result_*.csv"))
+    files = list(iter_matching_files(input_dir, "Result_*.csv"))
     if not files:
         raise FileNotFoundError(f"Result_*.csv が見つかりません: {input_dir}")
-    # step番号が取れるものを優先してソート
-    with_steps = []
-    without_steps = []
-    for p in files:
+
+    # step番号が取れるものを優先してその番号順、取れないものは名前順で後ろに置く（同順位はパス順）
+    def sort_key(p: Path) -> tuple[int, int | str, Path]:
         n = _parse_step_number(p)
         if n is None:
-            without_steps.append(p)
-        else:
-            with_steps.append((n, p))
-    with_steps.sort(key=lambda x: x[0])
-    without_steps.sort(key=lambda p: p.name)
-    return [p for _, p in with_steps] + without_steps
+            return (1, p.name, p)
+        return (0, n, p)
+
+    return sorted(files, key=sort_key)
 
 
 def _read_iric_result_csv(
-    csv_path: Path, *, usecols: list[str] | None = None
+    csv_path: Path, *, usecols: list[str] | None = None, dtype: dict[str, str] | None = None
 ) -> tuple[float, int, int, pd.DataFrame]:
-    with csv_path.open("r", encoding="utf-8-sig") as f:
-        first = f.readline().strip()
-        second = f.readline().strip()
-
-    try:
-        time_val = float(first.split("=", 1)[1].strip())
-    except Exception as e:
-        raise ValueError(f"時刻取得エラー: {first}") from e
-
-    try:
-        imax_s, jmax_s = second.split(",", 1)
-        imax, jmax = int(imax_s), int(jmax_s)
-    except Exception:
-        imax, jmax = 0, 0
-
-    df = pd.read_csv(csv_path, skiprows=2, encoding="utf-8-sig", usecols=usecols)
+    # ファイルは 1 回だけ開き、先頭 2 行を読んだ位置から続けて pandas に渡す
+    with csv_path.open("rb") as f:
+        first = f.readline().decode("utf-8-sig", errors="replace").strip()
+        second = f.readline().decode("utf-8", errors="replace").strip()
+
+        try:
+            time_val = float(first.split("=", 1)[1].strip())
+        except Exception as e:
+            raise ValueError(f"時刻取得エラー: {first}") from e
+
+        try:
+            imax_s, jmax_s = second.split(",", 1)
+            imax, jmax = int(imax_s), int(jmax_s)
+        except Exception:
+            imax, jmax = 0, 0
+
+        df = pd.read_csv(f, usecols=usecols, dtype=dtype)
     return time_val, imax, jmax, df
 
 
@@ -144,6 +253,13 @@ class DataSource:
     steps: list[int] = None  # type: ignore[assignment]
     domain_bounds: tuple[float, float, float, float] = (0.0, 1.0, 0.0, 1.0)
     _csv_files: list[Path] | None = None
+    # セッション中に開いた CGNS（path -> h5py.File、古い順）。close() でまとめて閉じる
+    _h5_files: dict = field(default_factory=dict, repr=False)
+    _h5_lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+    # list_value_columns() の結果（GUI から繰り返し呼ばれるため、初回の走査結果を使い回す）
+    _value_cols_cache: list[str] | None = field(default=None, repr=False)
+    # step -> steps 内の位置（get_frame で毎回 list.index を引かないため）
+    _step_to_idx: dict[int, int] = field(default_factory=dict, repr=False)
 
     @classmethod
     def from_input(
@@ -181,6 +297,13 @@ class DataSource:
         raise ValueError(f"未対応の入力です: {p}")
 
     def close(self) -> None:
+        with self._h5_lock:
+            files = list(self._h5_files.values())
+            self._h5_files.clear()
+        self._value_cols_cache = None
+        # 一時フォルダを削除する前に閉じる（Windows では開いたままだと削除できない）
+        for f in files:
+            f.close()
         if self._tmpdir is not None:
             try:
                 self._tmpdir.cleanup()
@@ -189,10 +312,28 @@ class DataSource:
 
     # --- CGNS -------------------------------------------------------------
 
+    def _get_h5(self, path: Path):
+        """
+        path の CGNS を開いて返す。ファイルを開くたびのメタデータ解析を避けるため、
+        セッション中は開いたまま使い回す（最大 _H5_CACHE_SIZE 個、close() で閉じる）。
+        """
+        from iRIC_DataScope.common.cgns_reader import open_cgns
+
+        with self._h5_lock:
+            f = self._h5_files.pop(path, None)
+            if f is None:
+                f = open_cgns(path)
+                while len(self._h5_files) >= _H5_CACHE_SIZE:
+                    self._h5_files.pop(next(iter(self._h5_files))).close()
+            self._h5_files[path] = f
+            return f
+
+    def _open_h5(self, path: Path):
+        # with 文で使うが、閉じずにキャッシュに残す
+        return nullcontext(self._get_h5(path))
+
     def _init_cgns(self) -> None:
         from iRIC_DataScope.common.cgns_reader import resolve_case_cgn
-        import h5py
-        import numpy as _np
 
         if self.input_path.is_dir():
             info = discover_project_cgns(self.input_path, case_name=self.case_name)
@@ -212,16 +353,15 @@ class DataSource:
         if not self.cgn_path:
             raise RuntimeError("cgn_path の初期化に失敗しました")
 
-        with h5py.File(self.cgn_path, "r") as f:
+        with self._open_h5(self.cgn_path) as f:
             zone = self.zone_path.strip("/")
             self.step_count = 0
             if self.grid_location == "node":
                 ptr_path = f"{zone}/ZoneIterativeData/FlowSolutionPointers"
                 if ptr_path in f:
                     try:
-                        ptr = f[ptr_path][(" data")]
-                        a = _np.asarray(ptr[()])
-                        self.step_count = int(a.shape[0])
+                        # ステップ数は形状だけで分かるため、ポインタ配列は読まない
+                        self.step_count = int(f[ptr_path][" data"].shape[0])
                     except Exception as e:
                         logger.info("FlowSolutionPointers の読み込みに失敗したためフォールバックします: %s", e)
                         self.step_count = 0
@@ -238,17 +378,9 @@ class DataSource:
                     self.step_count = 1
             self.steps = list(range(1, self.step_count + 1))
 
-            x = _np.asarray(f[f"{zone}/GridCoordinates/CoordinateX"][" data"][()])
-            y = _np.asarray(f[f"{zone}/GridCoordinates/CoordinateY"][" data"][()])
-            if self.grid_location == "cell":
-                x = _compute_cell_centers(x)
-                y = _compute_cell_centers(y)
-            self.domain_bounds = (float(x.min()), float(x.max()), float(y.min()), float(y.max()))
+            self.domain_bounds = self._read_domain_bounds(f, zone)
 
     def _init_cgns_series(self) -> None:
-        import h5py
-        import numpy as _np
-
         if self.input_path.is_dir():
             extracted = list_solution_cgns_in_dir(self.input_path)
             if not extracted:
@@ -267,17 +399,11 @@ class DataSource:
 
             self._tmpdir = tempfile.TemporaryDirectory(prefix="ipro_solution_")
             td_path = Path(self._tmpdir.name)
-            extracted = []
+            extracted = extract_zip_members(self.input_path, sol_names, td_path)
             steps: list[int] = []
-
-            with zipfile.ZipFile(self.input_path, "r") as z:
-                for idx, name in enumerate(sol_names, start=1):
-                    out = td_path / Path(name).name
-                    with z.open(name) as src, out.open("wb") as dst:
-                        dst.write(src.read())
-                    extracted.append(out)
-                    n = parse_solution_step(Path(name).name)
-                    steps.append(n if n is not None else idx)
+            for idx, p in enumerate(extracted, start=1):
+                n = parse_solution_step(p.name)
+                steps.append(n if n is not None else idx)
 
             if not extracted:
                 raise RuntimeError("Solution*.cgn の展開に失敗しました")
@@ -285,22 +411,36 @@ class DataSource:
             self.cgn_paths = extracted
             self.steps = steps
             self.step_count = len(extracted)
+        self._step_to_idx = _index_steps(self.steps)
 
         zone = self.zone_path.strip("/")
-        with h5py.File(extracted[0], "r") as f:
+        with self._open_h5(extracted[0]) as f:
             if zone not in f:
                 raise KeyError(f"{zone} が見つかりません: {extracted[0]}")
-            x = _np.asarray(f[f"{zone}/GridCoordinates/CoordinateX"][" data"][()])
-            y = _np.asarray(f[f"{zone}/GridCoordinates/CoordinateY"][" data"][()])
+            self.domain_bounds = self._read_domain_bounds(f, zone)
+
+    def _read_domain_bounds(self, f, zone: str) -> tuple[float, float, float, float]:
+        """座標の範囲 (xmin, xmax, ymin, ymax) を返す。"""
+
+        def axis_bounds(axis: str) -> tuple[float, float]:
+            a = _read_data_array(f, f"{zone}/GridCoordinates/{axis}")
             if self.grid_location == "cell":
-                x = _compute_cell_centers(x)
-                y = _compute_cell_centers(y)
-            self.domain_bounds = (float(x.min()), float(x.max()), float(y.min()), float(y.max()))
+                a = _compute_cell_centers(a)
+            return float(a.min()), float(a.max())
+
+        # 座標は 1 軸ずつ読み、範囲を取ったら捨てる（格子サイズの配列を同時に 2 本持たない）
+        xmin, xmax = axis_bounds("CoordinateX")
+        ymin, ymax = axis_bounds("CoordinateY")
+        return xmin, xmax, ymin, ymax
 
     def list_value_columns(self) -> list[str]:
-        if self.kind == "csv_dir":
-            return self._list_csv_value_columns()
-        return self._list_cgns_value_columns()
+        if self._value_cols_cache is None:
+            if self.kind == "csv_dir":
+                self._value_cols_cache = self._list_csv_value_columns()
+            else:
+                self._value_cols_cache = self._list_cgns_value_columns()
+        # 呼び出し側で書き換えられてもキャッシュに影響しないよう、コピーを返す
+        return list(self._value_cols_cache)
 
     def _list_cgns_value_columns(self) -> list[str]:
         if self.kind == "cgns_series":
@@ -316,7 +456,7 @@ class DataSource:
 
         zone = self.zone_path.strip("/")
 
-        with h5py.File(cgn_path, "r") as f:
+        with self._open_h5(cgn_path) as f:
             x = f[f"{zone}/GridCoordinates/CoordinateX"][" data"]
             if self.grid_location == "cell":
                 coord_shape = (int(x.shape[0]) - 1, int(x.shape[1]) - 1)
@@ -327,9 +467,11 @@ class DataSource:
                 ptr_path = f"{zone}/ZoneIterativeData/FlowSolutionPointers"
                 if ptr_path in f:
                     try:
-                        ptr = _np.asarray(f[ptr_path][" data"][()])
+                        ptr = f[ptr_path][" data"]
                         if ptr.ndim == 2 and ptr.shape[0] >= 1:
-                            first_name = bytes(ptr[0].tolist()).decode("ascii", errors="ignore").replace("\x00", "").strip()
+                            # 先頭のステップ名だけが必要なので、1 行目だけを読む
+                            row = _np.asarray(ptr[0])
+                            first_name = row.tobytes().decode("ascii", errors="ignore").replace("\x00", "").strip()
                     except Exception:
                         first_name = ""
             if not first_name:
@@ -346,18 +488,24 @@ class DataSource:
                 return []
             g = f[sol_path]
             out: list[str] = []
-            for k, node in g.items():
+            # items() は子ノードをすべて h5py オブジェクトとして開くため、名前だけを列挙し、
+            # 各変数は "<name>/ data" を低レベル API で直接開いて形状だけを見る（Dataset を作らない）
+            gid = g.id
+            for k in g:
                 if k == "GridLocation":
                     continue
-                if isinstance(node, h5py.Group):
-                    if " data" not in node:
+                try:
+                    did = h5py.h5d.open(gid, f"{k}/ data".encode())
+                except KeyError:
+                    # グループではなくデータセットが直接置かれている場合
+                    try:
+                        did = h5py.h5d.open(gid, k.encode())
+                    except KeyError:
                         continue
-                    shape = tuple(node[" data"].shape)
-                else:
-                    shape = tuple(node.shape)
-                if shape == coord_shape:
+                if did.shape == coord_shape:
                     out.append(k)
-            return sorted(out)
+            out.sort()
+            return out
 
     def iter_frames(self, *, value_col: str) -> Iterable["IricStepFrame"]:
         yield from self.iter_frames_with_columns(value_cols=[value_col])
@@ -368,12 +516,13 @@ class DataSource:
     def iter_frames_with_columns(self, *, value_cols: list[str]) -> Iterable["IricStepFrame"]:
         cols = _dedupe_columns(value_cols)
         if self.kind == "csv_dir":
-            yield from self._iter_csv_frames(value_cols=cols)
-            return
-        if self.kind == "cgns_series":
-            yield from self._iter_cgns_series_frames(value_cols=cols)
-            return
-        yield from self._iter_cgns_frames(value_cols=cols)
+            frames = self._iter_csv_frames(value_cols=cols)
+        elif self.kind == "cgns_series":
+            frames = self._iter_cgns_series_frames(value_cols=cols)
+        else:
+            frames = self._iter_cgns_frames(value_cols=cols)
+        # 呼び出し側が前のステップを処理している間に、次のステップを読み込んでおく
+        yield from _prefetch(frames)
 
     def get_frame_with_columns(self, *, step: int, value_cols: list[str]):
         cols = _dedupe_columns(value_cols)
@@ -389,7 +538,7 @@ class DataSource:
         if not self.cgn_path:
             raise RuntimeError("CGNS が初期化されていません")
         yield from iter_iric_step_frames(
-            self.cgn_path,
+            self._get_h5(self.cgn_path),
             zone_path=self.zone_path,
             grid_location=self.grid_location,
             vars_keep=value_cols,
@@ -406,7 +555,7 @@ class DataSource:
         if not self.cgn_path:
             raise RuntimeError("CGNS が初期化されていません")
         gen = iter_iric_step_frames(
-            self.cgn_path,
+            self._get_h5(self.cgn_path),
             zone_path=self.zone_path,
             grid_location=self.grid_location,
             vars_keep=value_cols,
@@ -455,14 +604,13 @@ class DataSource:
         if not self.cgn_paths:
             raise FileNotFoundError("Solution CGNS がありません")
 
-        if step in self.steps:
-            idx = self.steps.index(step)
-        else:
+        idx = self._step_to_idx.get(step)
+        if idx is None:
             idx = max(0, min(step - 1, len(self.cgn_paths) - 1))
         cgn_path = self.cgn_paths[idx]
 
         gen = iter_iric_step_frames(
-            cgn_path,
+            self._get_h5(cgn_path),
             zone_path=self.zone_path,
             grid_location=self.grid_location,
             vars_keep=value_cols,
@@ -494,9 +642,10 @@ class DataSource:
             steps.append(n if n is not None else i)
         self.steps = steps
         self.step_count = len(steps)
+        self._step_to_idx = _index_steps(steps)
 
-        # bounds は1ファイル目から推定
-        t, imax, jmax, df0 = _read_iric_result_csv(files[0], usecols=["X", "Y"])
+        # bounds は1ファイル目から推定（X/Y の 2 列だけを、型推定なしで読む）
+        t, imax, jmax, df0 = _read_iric_result_csv(files[0], usecols=["X", "Y"], dtype=_CSV_COORD_DTYPES)
         self.domain_bounds = (
             float(df0["X"].min()),
             float(df0["X"].max()),
@@ -509,7 +658,7 @@ class DataSource:
             return []
         p0 = self._csv_files[0]
         df_head = pd.read_csv(p0, skiprows=2, encoding="utf-8-sig", nrows=0)
-        cols = [c for c in df_head.columns if c not in {"I", "J", "X", "Y"}]
+        cols = [c for c in df_head.columns if c not in _CSV_INDEX_COLS]
         return cols
 
     def _iter_csv_frames(self, *, value_cols: list[str]):
@@ -517,11 +666,16 @@ class DataSource:
 
         if not self._csv_files:
             return
-        for idx, p in enumerate(self._csv_files):
-            step = self.steps[idx]
-            cols = _dedupe_columns(["I", "J", "X", "Y", *value_cols])
-            t, imax, jmax, df = _read_iric_result_csv(p, usecols=cols)
-            yield IricStepFrame(step=step, time=t, imax=imax, jmax=jmax, location=None, df=df)
+        files = self._csv_files
+        cols = _dedupe_columns(["I", "J", "X", "Y", *value_cols])
+
+        def read(idx: int) -> IricStepFrame:
+            t, imax, jmax, df = _read_iric_result_csv(files[idx], usecols=cols, dtype=_CSV_COORD_DTYPES)
+            return IricStepFrame(step=self.steps[idx], time=t, imax=imax, jmax=jmax, location=None, df=df)
+
+        # 各ファイルは独立しているため、CPU が複数あれば次の数ステップを並列に解析しておく
+        workers = min(_CSV_READ_WORKERS, os.cpu_count() or 1)
+        yield from _map_ordered(read, range(len(files)), workers)
 
     def _get_csv_frame(self, *, step: int, value_cols: list[str]):
         from iRIC_DataScope.common.cgns_reader import IricStepFrame
@@ -529,11 +683,10 @@ class DataSource:
         if not self._csv_files:
             raise FileNotFoundError("CSVがありません")
         # step が存在すればそのファイル、無ければ index として扱う
-        if step in self.steps:
-            idx = self.steps.index(step)
-        else:
+        idx = self._step_to_idx.get(step)
+        if idx is None:
             idx = max(0, min(step - 1, len(self._csv_files) - 1))
         p = self._csv_files[idx]
         cols = _dedupe_columns(["I", "J", "X", "Y", *value_cols])
-        t, imax, jmax, df = _read_iric_result_csv(p, usecols=cols)
+        t, imax, jmax, df = _read_iric_result_csv(p, usecols=cols, dtype=_CSV_COORD_DTYPES)
         return IricStepFrame(step=self.steps[idx], time=t, imax=imax, jmax=jmax, location=None, df=df)
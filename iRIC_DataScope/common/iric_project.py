@@ -1,10 +1,25 @@
 from __future__ import annotations
 
+import fnmatch
+import os
 import re
+import shutil
+import stat
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Literal
+from typing import Iterator, Literal
+
+
+_RE_SOLUTION_NAME = re.compile(r"Solution(\d+)\.cgn$", re.IGNORECASE)
+# zip 内のパス（フォルダ付き）に対して Solution<n>.cgn を探す。n もここで取り出す
+_RE_SOLUTION_MEMBER = re.compile(r"(?:^|/)Solution(\d+)\.cgn$", re.IGNORECASE)
+
+# .ipro から CGNS を取り出す際のコピー単位（既定の 64 KiB では数 GB の展開でループが多すぎる）
+ZIP_COPY_BUFSIZE = 4 * 1024 * 1024
+# 複数の CGNS を並列に取り出す際のスレッド数の上限（zlib の展開・CRC 計算は GIL を解放する）
+ZIP_EXTRACT_WORKERS = 4
 
 
 @dataclass(frozen=True)
@@ -14,7 +29,7 @@ class ProjectCgns:
 
 
 def parse_solution_step(name: str) -> int | None:
-    m = re.search(r"Solution(\d+)\.cgn$", name, flags=re.IGNORECASE)
+    m = _RE_SOLUTION_NAME.search(name)
     if not m:
         return None
     try:
@@ -30,21 +45,52 @@ def list_solution_cgns_in_ipro(ipro_path: Path) -> list[str]:
     except Exception:
         return []
 
-    hits: list[tuple[int, str]] = []
-    for name in names:
-        if re.search(r"(?:^|/)Solution\d+\.cgn$", name, flags=re.IGNORECASE):
-            n = parse_solution_step(Path(name).name)
-            if n is None:
-                n = 10**9
-            hits.append((n, name))
+    hits = [(int(m.group(1)), name) for name in names if (m := _RE_SOLUTION_MEMBER.search(name))]
     if not hits:
         return []
     hits.sort(key=lambda x: x[0])
     return [name for _, name in hits]
 
 
+def extract_zip_member(z: zipfile.ZipFile, name: str, dest: Path) -> Path:
+    """zip 内の name を dest に書き出す（メモリに全体を読み込まず、大きめの単位でコピーする）。"""
+    # 書き込みは毎回 ZIP_COPY_BUFSIZE 単位になるため、書き込み側のバッファは挟まない
+    with z.open(name) as src, dest.open("wb", buffering=0) as dst:
+        shutil.copyfileobj(src, dst, ZIP_COPY_BUFSIZE)
+    return dest
+
+
+def extract_zip_members(zip_path: Path, names: list[str], dest_dir: Path) -> list[Path]:
+    """
+    zip 内の names を dest_dir 直下に（ファイル名のみで）書き出し、names と同じ順にパスを返す。
+
+    複数ある場合はスレッドで並列に展開する（ファイル名が重複する場合は逐次）。ZipFile はハンドルを共有するとスレッド安全でないため、
+    スレッドごとに開き直し、担当する名前をまとめて展開する。
+    """
+    pairs = [(name, dest_dir / name.rsplit("/", 1)[-1]) for name in names]
+    workers = min(ZIP_EXTRACT_WORKERS, len(pairs), os.cpu_count() or 1)
+    if len({dest for _, dest in pairs}) < len(pairs):
+        # 別フォルダに同じファイル名があると、並列では同じ書き出し先を奪い合って結果が定まらない。
+        # その場合は names の順に逐次展開する（従来どおり後のものが残る）
+        workers = 1
+
+    def extract_all(chunk: list[tuple[str, Path]]) -> None:
+        with zipfile.ZipFile(zip_path, "r") as z:
+            for name, dest in chunk:
+                extract_zip_member(z, name, dest)
+
+    if workers <= 1:
+        extract_all(pairs)
+    else:
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="ipro-extract") as ex:
+            futures = [ex.submit(extract_all, pairs[k::workers]) for k in range(workers)]
+            for fut in futures:
+                fut.result()
+    return [dest for _, dest in pairs]
+
+
 def list_solution_cgns_in_dir(project_dir: Path) -> list[Path]:
-    candidates = list(project_dir.rglob("Solution*.cgn"))
+    candidates = list(iter_matching_files(project_dir, "Solution*.cgn"))
     if not candidates:
         return []
 
@@ -57,14 +103,42 @@ def list_solution_cgns_in_dir(project_dir: Path) -> list[Path]:
     return sorted(candidates, key=sort_key)
 
 
+def iter_matching_files(
+    root: str | os.PathLike[str], pattern: str, *, skip_hidden: bool = False, follow_symlinks: bool = False
+) -> Iterator[Path]:
+    """
+    root 配下を os.scandir で再帰的に走査し、ファイル名が pattern に一致するファイルを返す。
+
+    DirEntry のキャッシュ済み種別を使うため、Path.rglob と違いエントリごとの stat が不要。
+    呼び出し側が途中で打ち切れば、それ以降のフォルダは走査しない。
+    skip_hidden=True では名前が "." で始まるファイル・フォルダを対象外にし、
+    follow_symlinks=True ではフォルダへのシンボリックリンクもたどる（glob の "**" と同じ扱い）。
+    """
+    stack = [os.fspath(root)]
+    while stack:
+        try:
+            it = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with it:
+            for entry in it:
+                if skip_hidden and entry.name.startswith("."):
+                    continue
+                try:
+                    if entry.is_dir(follow_symlinks=follow_symlinks):
+                        stack.append(entry.path)
+                    elif fnmatch.fnmatch(entry.name, pattern) and entry.is_file():
+                        yield Path(entry.path)
+                except OSError:
+                    continue
+
+
 def has_result_csv(input_dir: Path) -> bool:
-    for _ in input_dir.rglob("Result_*.csv"):
-        return True
-    return False
+    return next(iter_matching_files(input_dir, "Result_*.csv"), None) is not None
 
 
 def find_case_cgn(project_dir: Path, case_name: str) -> Path | None:
-    hits = sorted(project_dir.rglob(case_name))
+    hits = sorted(iter_matching_files(project_dir, case_name))
     if hits:
         return hits[0]
     return None
@@ -82,7 +156,7 @@ def discover_project_cgns(project_dir: Path, case_name: str = "Case1.cgn") -> Pr
     if case_path:
         return ProjectCgns(kind="single", paths=[case_path])
 
-    cgns = sorted(project_dir.rglob("*.cgn"))
+    cgns = sorted(iter_matching_files(project_dir, "*.cgn"))
     if not cgns:
         raise FileNotFoundError(f"CGNS が見つかりません: {project_dir}")
     if len(cgns) == 1:
@@ -92,9 +166,29 @@ def discover_project_cgns(project_dir: Path, case_name: str = "Case1.cgn") -> Pr
     )
 
 
+def _has_top_level_file(root: Path, patterns: tuple[str, ...]) -> bool:
+    """root 直下（サブフォルダは見ない）に、名前がいずれかの patterns に一致するファイルがあるか。"""
+    try:
+        it = os.scandir(root)
+    except OSError:
+        return False
+    with it:
+        for entry in it:
+            try:
+                if any(fnmatch.fnmatch(entry.name, pat) for pat in patterns) and entry.is_file():
+                    return True
+            except OSError:
+                continue
+    return False
+
+
 def classify_input_dir(input_dir: Path, case_name: str = "Case1.cgn") -> Literal["csv_dir", "project_dir"]:
     if not input_dir.is_dir():
         raise NotADirectoryError(f"フォルダではありません: {input_dir}")
+    # 直下に Case1.cgn / Solution*.cgn があれば discover_project_cgns は必ず成功するため、
+    # 配下を再帰的に走査せずにプロジェクトフォルダと判定する
+    if _has_top_level_file(input_dir, (case_name, "Solution*.cgn")):
+        return "project_dir"
     has_csv = has_result_csv(input_dir)
     has_project = True
     project_error: Exception | None = None
@@ -113,13 +207,18 @@ def classify_input_dir(input_dir: Path, case_name: str = "Case1.cgn") -> Literal
     raise FileNotFoundError(f"Result_*.csv または CGNS が見つかりません: {input_dir}")
 
 
-def is_valid_input_path(input_path: Path | None, case_name: str = "Case1.cgn") -> bool:
+def is_valid_input_path(input_path: Path | str | None, case_name: str = "Case1.cgn") -> bool:
     if not input_path:
         return False
-    if input_path.is_dir():
+    # フォルダ／ファイルの判定は stat 1 回で済ませる
+    try:
+        mode = os.stat(input_path).st_mode
+    except (OSError, ValueError):
+        return False
+    if stat.S_ISDIR(mode):
         try:
-            classify_input_dir(input_path, case_name=case_name)
+            classify_input_dir(Path(input_path), case_name=case_name)
             return True
         except Exception:
             return False
-    return input_path.is_file() and input_path.suffix.lower() in {".ipro", ".cgn"}
+    return stat.S_ISREG(mode) and os.path.splitext(input_path)[1].lower() in {".ipro", ".cgn"}
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import multiprocessing as mp
+import os
 from multiprocessing.synchronize import Event as MpEvent
 import sys
 from pathlib import Path
@@ -23,7 +24,7 @@ def _splash_worker(done: MpEvent, splash_path: Path) -> None:
     image = None
     if splash_path.is_file():
         try:
-            image = tk.PhotoImage(file=str(splash_path))
+            image = tk.PhotoImage(file=os.fspath(splash_path))
         except Exception:
             image = None
 
@@ -34,7 +35,6 @@ def _splash_worker(done: MpEvent, splash_path: Path) -> None:
 
     label = tk.Label(splash, image=image, borderwidth=0, highlightthickness=0)
     label.pack()
-    splash.update_idletasks()
     width = image.width()
     height = image.height()
     x = (splash.winfo_screenwidth() - width) // 2
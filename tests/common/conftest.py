@@ -0,0 +1,52 @@
+"""CGNS 入力を扱うテスト向けに、最小構成の iRIC 風 CGNS を生成する fixture を提供する。"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+h5py = pytest.importorskip("h5py")
+
+DATA = " data"
+ZONE = "iRIC/iRICZone"
+SHAPE = (3, 2)
+
+
+def _chars(text: str, width: int | None = None) -> np.ndarray:
+    raw = text.encode("ascii")
+    if width is not None:
+        raw = raw.ljust(width, b"\x00")
+    return np.frombuffer(raw, dtype=np.int8).copy()
+
+
+def write_iric_cgns(path: Path, *, nstep: int = 2, times: list[float] | None = None) -> Path:
+    """座標 (3x2) と nstep 個の FlowSolution を持つ CGNS を書き出す。"""
+    x = np.arange(6, dtype=np.float64).reshape(SHAPE)
+    y = x * 10.0
+    with h5py.File(path, "w") as f:
+        f.create_dataset(f"{ZONE}/GridCoordinates/CoordinateX/{DATA}", data=x)
+        f.create_dataset(f"{ZONE}/GridCoordinates/CoordinateY/{DATA}", data=y)
+        names = [f"FlowSolution{i}" for i in range(1, nstep + 1)]
+        for i, name in enumerate(names, start=1):
+            sol = f"{ZONE}/{name}"
+            f.create_dataset(f"{sol}/GridLocation/{DATA}", data=_chars("Vertex"))
+            f.create_dataset(f"{sol}/depth/{DATA}", data=x * i)
+            f.create_dataset(f"{sol}/elevation/{DATA}", data=y + i)
+            f.create_dataset(f"{sol}/bad_shape/{DATA}", data=np.zeros((2, 2)))
+        ptrs = np.stack([_chars(n, 32) for n in names])
+        f.create_dataset(f"{ZONE}/ZoneIterativeData/FlowSolutionPointers/{DATA}", data=ptrs)
+        tv = np.asarray(times if times is not None else [float(i) * 0.5 for i in range(1, nstep + 1)])
+        f.create_dataset(f"iRIC/BaseIterativeData/TimeValues/{DATA}", data=tv)
+    return path
+
+
+@pytest.fixture
+def make_iric_cgns():
+    return write_iric_cgns
+
+
+@pytest.fixture
+def iric_cgns(tmp_path: Path) -> Path:
+    return write_iric_cgns(tmp_path / "Case1.cgn")
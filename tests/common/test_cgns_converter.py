@@ -0,0 +1,257 @@
+"""CGNS から iRIC 互換 CSV への変換を検証する。"""
+
+from __future__ import annotations
+
+import zipfile
+from pathlib import Path
+
+import pandas as pd
+
+from iRIC_DataScope.common.cgns_converter import convert_iric_project, export_iric_like_csv
+from iRIC_DataScope.common.cgns_reader import iter_iric_step_frames, resolve_case_cgn
+
+
+def _read_result(path: Path) -> tuple[list[str], pd.DataFrame]:
+    lines = path.read_text(encoding="utf-8-sig").splitlines()
+    return lines[:2], pd.read_csv(path, skiprows=2, encoding="utf-8-sig")
+
+
+def test_iter_iric_step_frames_columns_and_order(iric_cgns: Path) -> None:
+    frames = list(iter_iric_step_frames(iric_cgns))
+
+    assert [f.step for f in frames] == [1, 2]
+    assert [f.time for f in frames] == [0.5, 1.0]
+    first = frames[0]
+    assert (first.imax, first.jmax) == (3, 2)
+    assert first.location == "VERTEX"
+    assert list(first.df.columns) == ["I", "J", "X", "Y", "depth", "elevation"]
+    # Fortran 順: I が先に回る
+    assert first.df["I"].tolist() == [1, 2, 3, 1, 2, 3]
+    assert first.df["J"].tolist() == [1, 1, 1, 2, 2, 2]
+    assert first.df["X"].tolist() == [0.0, 2.0, 4.0, 1.0, 3.0, 5.0]
+    # 読み込みバッファを使い回しても、取得済みのステップの値は変わらない
+    assert first.df["depth"].tolist() == [0.0, 2.0, 4.0, 1.0, 3.0, 5.0]
+    assert frames[1].df["depth"].tolist() == [0.0, 4.0, 8.0, 2.0, 6.0, 10.0]
+
+
+def test_iter_iric_step_frames_c_order(iric_cgns: Path) -> None:
+    frame = next(iter_iric_step_frames(iric_cgns, fortran_order=False))
+
+    assert frame.df["I"].tolist() == [1, 1, 2, 2, 3, 3]
+    assert frame.df["J"].tolist() == [1, 2, 1, 2, 1, 2]
+    assert frame.df["X"].tolist() == [0.0, 1.0, 2.0, 3.0, 4.0, 5.0]
+
+
+def test_iter_iric_step_frames_c_order_frames_are_independent(iric_cgns: Path) -> None:
+    first, second = iter_iric_step_frames(iric_cgns, fortran_order=False)
+
+    assert first.df["depth"].tolist() == [0.0, 1.0, 2.0, 3.0, 4.0, 5.0]
+    assert second.df["depth"].tolist() == [0.0, 2.0, 4.0, 6.0, 8.0, 10.0]
+    # 座標列はステップ間で共有されるため、書き換えできない
+    assert not first.df["X"].to_numpy().flags.writeable
+
+
+def test_iter_iric_step_frames_vars_keep_and_range(iric_cgns: Path) -> None:
+    frames = list(iter_iric_step_frames(iric_cgns, vars_keep=["elevation"], step_from=2))
+
+    assert [f.step for f in frames] == [2]
+    assert list(frames[0].df.columns) == ["I", "J", "X", "Y", "elevation"]
+
+
+def test_iter_iric_step_frames_cell_location(iric_cgns: Path) -> None:
+    frame = next(iter_iric_step_frames(iric_cgns, grid_location="cell", include_flow_solution=False))
+
+    assert (frame.imax, frame.jmax) == (2, 1)
+    assert frame.df["X"].tolist() == [1.5, 3.5]
+
+
+def test_export_iric_like_csv_writes_result_files(iric_cgns: Path, tmp_path: Path) -> None:
+    out_dir = tmp_path / "out"
+    export_iric_like_csv(iric_cgns, out_dir)
+
+    header, df = _read_result(out_dir / "Result_2.csv")
+    assert header == ["iRIC output t = 1", "3,2"]
+    assert list(df.columns) == ["I", "J", "X", "Y", "depth", "elevation"]
+    assert df["elevation"].tolist() == [2.0, 22.0, 42.0, 12.0, 32.0, 52.0]
+    assert sorted(p.name for p in out_dir.iterdir()) == ["Result_1.csv", "Result_2.csv"]
+
+
+def test_iter_iric_step_frames_float_dtype(iric_cgns: Path) -> None:
+    frame = next(iter_iric_step_frames(iric_cgns, float_dtype="float32"))
+
+    assert frame.df["I"].dtype.kind == "i"
+    assert {str(frame.df[c].dtype) for c in ("X", "Y", "depth", "elevation")} == {"float32"}
+
+    c_frames = list(iter_iric_step_frames(iric_cgns, fortran_order=False, float_dtype="float32"))
+    assert str(c_frames[1].df["depth"].dtype) == "float32"
+    assert c_frames[1].df["depth"].tolist() == [0.0, 2.0, 4.0, 6.0, 8.0, 10.0]
+
+
+def test_export_iric_like_csv_float32(iric_cgns: Path, tmp_path: Path) -> None:
+    out_dir = tmp_path / "out"
+    export_iric_like_csv(iric_cgns, out_dir, step_to=1, float_dtype="float32")
+
+    lines = (out_dir / "Result_1.csv").read_text(encoding="utf-8-sig").splitlines()
+    assert lines[3].split(",") == ["1", "1", "0.0", "0.0", "0.0", "1.0"]
+
+
+def test_export_iric_like_csv_workers_match_sequential(make_iric_cgns, tmp_path: Path) -> None:
+    cgn = make_iric_cgns(tmp_path / "Case1.cgn", nstep=5)
+    seq_dir, par_dir = tmp_path / "seq", tmp_path / "par"
+    export_iric_like_csv(cgn, seq_dir, step_skip=2)
+    export_iric_like_csv(cgn, par_dir, step_skip=2, workers=2)
+
+    names = sorted(p.name for p in seq_dir.iterdir())
+    assert names == ["Result_1.csv", "Result_3.csv", "Result_5.csv"]
+    assert sorted(p.name for p in par_dir.iterdir()) == names
+    for name in names:
+        assert (par_dir / name).read_bytes() == (seq_dir / name).read_bytes()
+
+
+def test_export_iric_like_csv_workers_respect_step_range(make_iric_cgns, tmp_path: Path) -> None:
+    from iRIC_DataScope.common.cgns_reader import count_flow_solutions
+
+    cgn = make_iric_cgns(tmp_path / "Case1.cgn", nstep=5)
+    assert count_flow_solutions(cgn) == 5
+
+    out_dir = tmp_path / "out"
+    export_iric_like_csv(cgn, out_dir, step_from=2, step_to=4, workers=3)
+    assert sorted(p.name for p in out_dir.iterdir()) == ["Result_2.csv", "Result_3.csv", "Result_4.csv"]
+
+
+def test_convert_iric_project_from_ipro(iric_cgns: Path, tmp_path: Path) -> None:
+    ipro = tmp_path / "project.ipro"
+    with zipfile.ZipFile(ipro, "w") as z:
+        z.write(iric_cgns, "Case1.cgn")
+        z.writestr("project.xml", "<iRICProject/>")
+
+    out_dir = convert_iric_project(ipro, tmp_path / "converted")
+
+    header, df = _read_result(out_dir / "Result_1.csv")
+    assert header == ["iRIC output t = 0.5", "3,2"]
+    assert df.shape == (6, 6)
+
+
+def test_resolve_case_cgn_in_directory(iric_cgns: Path, tmp_path: Path) -> None:
+    nested = tmp_path / "proj" / "sub"
+    nested.mkdir(parents=True)
+    target = nested / "Case1.cgn"
+    target.write_bytes(iric_cgns.read_bytes())
+
+    with resolve_case_cgn(tmp_path / "proj", "Case1.cgn") as found:
+        assert found == target
+    with resolve_case_cgn(tmp_path / "proj", "Other.cgn") as found:
+        assert found == target
+
+
+def test_read_node_data_mmap_contiguous(iric_cgns: Path) -> None:
+    import h5py
+    import numpy as np
+
+    from iRIC_DataScope.common.cgns_reader import _read_node_data
+
+    with h5py.File(iric_cgns, "r") as f:
+        path = "iRIC/iRICZone/GridCoordinates/CoordinateX"
+        mapped = _read_node_data(f, path, mmap=True)
+        assert isinstance(mapped, np.memmap)
+        assert np.array_equal(mapped, _read_node_data(f, path))
+        del mapped
+
+
+def test_read_dataset_or_group_into_buffer(iric_cgns: Path) -> None:
+    import h5py
+    import numpy as np
+
+    from iRIC_DataScope.common.cgns_reader import _read_dataset_or_group
+
+    with h5py.File(iric_cgns, "r") as f:
+        group = f["iRIC/iRICZone/GridCoordinates/CoordinateX"]
+        out = np.empty(group[" data"].shape, dtype=group[" data"].dtype)
+        result = _read_dataset_or_group(group, out)
+        assert result is out
+        assert np.array_equal(out, group[" data"][()])
+
+
+def test_try_read_timevalues_custom_iterative_data_name(iric_cgns: Path) -> None:
+    import h5py
+
+    from iRIC_DataScope.common.cgns_reader import try_read_timevalues
+
+    with h5py.File(iric_cgns, "r+") as f:
+        f.move("iRIC/BaseIterativeData", "iRIC/MyIterativeData")
+    with h5py.File(iric_cgns, "r") as f:
+        assert try_read_timevalues(f, "iRIC/iRICZone").tolist() == [0.5, 1.0]
+        assert try_read_timevalues(f, "Other/Zone").tolist() == [0.5, 1.0]
+
+
+def test_decode_flow_solution_pointers_int8() -> None:
+    import numpy as np
+
+    from iRIC_DataScope.common.cgns_reader import _decode_flow_solution_pointers_int8
+
+    rows = [b"FlowSolution1\x00\x00\x00", b" Sol\x00ution2     ", b"\x00" * 16]
+    a = np.frombuffer(b"".join(rows), dtype=np.int8).reshape(3, 16)
+    assert _decode_flow_solution_pointers_int8(a) == ["FlowSolution1", "Solution2", ""]
+    # Fortran 順で読まれた配列でも同じ結果になる
+    assert _decode_flow_solution_pointers_int8(np.asfortranarray(a)) == ["FlowSolution1", "Solution2", ""]
+    assert _decode_flow_solution_pointers_int8(np.zeros((2, 0), dtype=np.int8)) == ["", ""]
+
+
+def test_pick_cgn_from_ipro(tmp_path: Path) -> None:
+    from iRIC_DataScope.common.cgns_reader import _pick_cgn_from_ipro
+
+    ipro = tmp_path / "project.ipro"
+    with zipfile.ZipFile(ipro, "w") as z:
+        z.writestr("small.cgn", b"x")
+        z.writestr("sub/large.cgn", b"xxxx")
+        z.writestr("sub/case1.CGN", b"xx")
+    with zipfile.ZipFile(ipro) as z:
+        assert _pick_cgn_from_ipro(z, "Case1.cgn") == "sub/case1.CGN"
+        assert _pick_cgn_from_ipro(z, "small.cgn") == "small.cgn"
+        assert _pick_cgn_from_ipro(z, "Missing.cgn") == "sub/large.cgn"
+
+
+def test_list_flow_solution_groups_sorted_by_suffix(tmp_path: Path) -> None:
+    import h5py
+
+    from iRIC_DataScope.common.cgns_reader import _list_flow_solution_groups
+
+    path = tmp_path / "sol.cgn"
+    with h5py.File(path, "w") as f:
+        for name in ["FlowSolution10", "FlowSolution2", "flowsolutionB", "FlowSolutionA", "GridCoordinates"]:
+            f.create_group(f"Base/Zone/{name}")
+        f.create_dataset("Base/Zone/FlowSolution1", data=[0])
+    with h5py.File(path, "r") as f:
+        assert _list_flow_solution_groups(f, "Base/Zone") == [
+            "FlowSolution2",
+            "FlowSolution10",
+            "FlowSolutionA",
+            "flowsolutionB",
+        ]
+        assert _list_flow_solution_groups(f, "Base/Missing") == []
+
+
+def test_pick_preferred_location() -> None:
+    from iRIC_DataScope.common.cgns_reader import _pick_preferred_location
+
+    both = {"VERTEX", "CELLCENTER"}
+    assert _pick_preferred_location(both, "auto") == "VERTEX"
+    assert _pick_preferred_location(both, "vertex") == "VERTEX"
+    assert _pick_preferred_location(both, "cell") == "CELLCENTER"
+    assert _pick_preferred_location({"CELL_CENTER"}, "vertex") == "CELL_CENTER"
+    assert _pick_preferred_location({"OTHER"}, "auto") is None
+
+
+def test_iter_iric_step_frames_opens_datasets_per_step(make_iric_cgns, tmp_path: Path) -> None:
+    import h5py
+
+    cgn = make_iric_cgns(tmp_path / "Case1.cgn", nstep=20)
+    with h5py.File(cgn, "r") as f:
+        frames = iter_iric_step_frames(f)
+        next(frames)
+        # 先頭のステップを返した時点で、後続ステップのデータセットは開いていない
+        assert h5py.h5f.get_obj_count(f.id, h5py.h5f.OBJ_DATASET) == 0
+        assert len(list(frames)) == 19
+        # 対象の変数が 1 つも無いステップでも座標だけのフレームを返す
+        only_coords = next(iter_iric_step_frames(f, vars_keep=["missing"]))
+        assert list(only_coords.df.columns) == ["I", "J", "X", "Y"]
@@ -0,0 +1,41 @@
+"""Result_*.csv の探索を検証する。"""
+
+from __future__ import annotations
+
+import glob
+import os
+from pathlib import Path
+
+import pytest
+
+from iRIC_DataScope.common.csv_reader import list_csv_files, read_iric_csv
+
+
+def test_list_csv_files_matches_recursive_glob(tmp_path: Path) -> None:
+    for rel in ["Result_2.csv", "Result_1.csv", "sub/Result_3.csv", "sub/deep/other.csv",
+                "notes.txt", ".hidden.csv", ".cache/Result_9.csv"]:
+        path = tmp_path / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("", encoding="utf-8")
+
+    expected = sorted(glob.glob(os.path.join(str(tmp_path), "**", "*.csv"), recursive=True))
+    assert list_csv_files(str(tmp_path)) == expected
+    assert len(expected) == 4
+
+
+def test_list_csv_files_errors(tmp_path: Path) -> None:
+    with pytest.raises(FileNotFoundError):
+        list_csv_files(str(tmp_path))
+    with pytest.raises(NotADirectoryError):
+        list_csv_files(str(tmp_path / "missing"))
+
+
+def test_read_iric_csv_with_bom(tmp_path: Path) -> None:
+    path = tmp_path / "Result_1.csv"
+    path.write_text("iRIC output t = 2.5\n2,1\nI,J,X,Y,depth\n1,1,0.0,0.0,\n2,1,1.0,0.0,0.25\n", encoding="utf-8-sig")
+
+    time, df = read_iric_csv(str(path))
+    assert time == 2.5
+    assert list(df.columns) == ["I", "J", "X", "Y", "depth"]
+    assert df["I"].tolist() == [1, 2]
+    assert df["depth"].isna().tolist() == [True, False]
@@ -0,0 +1,79 @@
+"""iRIC 互換 CSV 書き出しの出力内容を検証する。"""
+
+from __future__ import annotations
+
+import io
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from iRIC_DataScope.common import iric_csv_writer
+from iRIC_DataScope.common.iric_csv_writer import _write_csv_body
+
+
+def _render(df: pd.DataFrame) -> str:
+    buf = io.StringIO()
+    _write_csv_body(df, buf)
+    return buf.getvalue()
+
+
+@pytest.mark.parametrize(
+    "df",
+    [
+        pd.DataFrame(
+            {
+                "I": np.array([1, 2, 3], dtype=np.int64),
+                "J": np.array([1, 1, 1], dtype=np.int32),
+                "X": [1e-20, 123456789012.0, -0.0],
+                "depth(m)": [np.nan, np.inf, 0.1],
+            }
+        ),
+        pd.DataFrame({"X": np.array([0.1, 1e20, np.nan], dtype=np.float32), "I": [1, 2, 3]}),
+        pd.DataFrame({"X": [0.5, np.nan]}),
+        pd.DataFrame({"a,b": [1.0, 2.0]}),
+        pd.DataFrame({"X": pd.Series([], dtype=float)}),
+    ],
+)
+def test_write_csv_body_matches_to_csv(df: pd.DataFrame) -> None:
+    assert _render(df) == df.to_csv(index=False)
+
+
+def test_write_csv_body_spans_chunks(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(iric_csv_writer, "_CHUNK_ROWS", 4)
+    df = pd.DataFrame({"I": np.arange(10), "X": np.linspace(0.0, 1.0, 10)})
+
+    assert _render(df) == df.to_csv(index=False)
+
+
+def test_write_csv_body_reuses_base_prefixes_only_for_same_grid() -> None:
+    cache: dict = {}
+    grid = {"I": [1, 2], "J": [1, 1], "X": [0.5, 1.5], "Y": [2.0, 2.0]}
+    first = pd.DataFrame({**grid, "depth": [0.1, 0.2]})
+    second = pd.DataFrame({**grid, "depth": [0.3, np.nan]})
+    moved = pd.DataFrame({**grid, "X": [9.0, 9.5], "depth": [0.3, 0.4]})
+
+    for df in (first, second, moved):
+        buf = io.StringIO()
+        _write_csv_body(df, buf, cache)
+        assert buf.getvalue() == df.to_csv(index=False)
+    assert len(cache) == 1
+
+
+def test_export_iric_result_csv_writes_every_frame(tmp_path) -> None:
+    from iRIC_DataScope.common.cgns_reader import IricStepFrame
+    from iRIC_DataScope.common.iric_csv_writer import export_iric_result_csv
+
+    def frames():
+        for step in range(1, 6):
+            df = pd.DataFrame({"I": [1, 2], "J": [1, 1], "X": [0.0, 1.0], "Y": [0.0, 0.0], "v": [step, step]})
+            yield IricStepFrame(step=step, time=step * 0.5, imax=2, jmax=1, location=None, df=df)
+        raise RuntimeError("reader failed")
+
+    with pytest.raises(RuntimeError, match="reader failed"):
+        export_iric_result_csv(frames(), tmp_path)
+
+    assert sorted(p.name for p in tmp_path.iterdir()) == [f"Result_{i}.csv" for i in range(1, 6)]
+    lines = (tmp_path / "Result_5.csv").read_text(encoding="utf-8-sig").splitlines()
+    assert lines[0] == "iRIC output t = 2.5"
+    assert lines[-1] == "2,1,1.0,0.0,5"
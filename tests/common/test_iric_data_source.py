@@ -0,0 +1,177 @@
+"""CSV フォルダ・CGNS 入力の DataSource を検証する。"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from iRIC_DataScope.common.iric_data_source import DataSource
+
+
+def _write_result_csv(path: Path, *, t: float, offset: float = 0.0) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    rows = [
+        "iRIC output t = %g" % t,
+        "2,2",
+        "I,J,X,Y,depth(m)",
+    ]
+    for j in (1, 2):
+        for i in (1, 2):
+            rows.append(f"{i},{j},{i + offset},{j * 10.0},{i * j * t}")
+    path.write_text("\n".join(rows) + "\n", encoding="utf-8")
+
+
+@pytest.fixture
+def csv_dir(tmp_path: Path) -> Path:
+    _write_result_csv(tmp_path / "Result_10.csv", t=10.0)
+    _write_result_csv(tmp_path / "sub" / "Result_2.csv", t=2.0, offset=-1.0)
+    _write_result_csv(tmp_path / "Result_1.csv", t=1.0)
+    return tmp_path
+
+
+def test_csv_dir_steps_sorted_numerically(csv_dir: Path) -> None:
+    ds = DataSource.from_input(csv_dir)
+
+    assert ds.kind == "csv_dir"
+    assert ds.steps == [1, 2, 10]
+    assert ds.step_count == 3
+    assert ds.domain_bounds == (1.0, 2.0, 10.0, 20.0)
+    assert ds.list_value_columns() == ["depth(m)"]
+
+
+def test_csv_dir_frames(csv_dir: Path) -> None:
+    ds = DataSource.from_input(csv_dir)
+
+    frames = list(ds.iter_frames(value_col="depth(m)"))
+    assert [f.step for f in frames] == [1, 2, 10]
+    assert [f.time for f in frames] == [1.0, 2.0, 10.0]
+    assert list(frames[0].df.columns) == ["I", "J", "X", "Y", "depth(m)"]
+    assert frames[0].df["I"].dtype.kind == "i"
+
+    frame = ds.get_frame(step=10, value_col="depth(m)")
+    assert frame.step == 10
+    assert (frame.imax, frame.jmax) == (2, 2)
+    assert frame.df["depth(m)"].tolist() == [10.0, 20.0, 20.0, 40.0]
+    # 存在しない step は位置として扱う（範囲外は端に丸める）
+    assert ds.get_frame(step=2, value_col="depth(m)").step == 2
+    assert ds.get_frame(step=5, value_col="depth(m)").step == 10
+
+
+def test_prefetch_propagates_errors_and_closes_on_break() -> None:
+    from iRIC_DataScope.common.iric_data_source import _prefetch
+
+    closed = []
+
+    def numbers():
+        try:
+            yield from range(10)
+        finally:
+            closed.append(True)
+
+    it = _prefetch(numbers())
+    assert [next(it), next(it)] == [0, 1]
+    it.close()
+    assert closed == [True]
+
+    def failing():
+        yield 1
+        raise ValueError("boom")
+
+    with pytest.raises(ValueError, match="boom"):
+        list(_prefetch(failing()))
+
+
+def test_cgns_value_columns(iric_cgns: Path) -> None:
+    import h5py
+    import numpy as np
+
+    with h5py.File(iric_cgns, "r+") as f:
+        # グループを挟まずにデータセットが置かれた変数も対象にする
+        f.create_dataset("iRIC/iRICZone/FlowSolution1/velocity", data=np.zeros((3, 2)))
+        f.create_group("iRIC/iRICZone/FlowSolution1/empty")
+
+    ds = DataSource.from_input(iric_cgns)
+    try:
+        assert ds.kind == "cgns"
+        assert ds.list_value_columns() == ["depth", "elevation", "velocity"]
+    finally:
+        ds.close()
+
+
+def test_cgns_file_handle_reused_until_close(iric_cgns: Path) -> None:
+    ds = DataSource.from_input(iric_cgns)
+    try:
+        assert ds.get_frame(step=2, value_col="depth").df["depth"].tolist() == [0.0, 4.0, 8.0, 2.0, 6.0, 10.0]
+        assert [f.step for f in ds.iter_frames(value_col="depth")] == [1, 2]
+        assert len(ds._h5_files) == 1
+        handle = next(iter(ds._h5_files.values()))
+        assert ds._get_h5(iric_cgns) is handle
+    finally:
+        ds.close()
+    assert ds._h5_files == {}
+    assert not handle.id.valid
+
+
+def test_cgns_cell_location_bounds(iric_cgns: Path) -> None:
+    ds = DataSource.from_input(iric_cgns, grid_location="cell")
+    try:
+        # 3x2 の格子点 (x=0..5, y=10x) からセル中心 2x1 を求める
+        assert ds.domain_bounds == (1.5, 3.5, 15.0, 35.0)
+    finally:
+        ds.close()
+
+
+def test_value_columns_cached_until_close(iric_cgns: Path, monkeypatch) -> None:
+    ds = DataSource.from_input(iric_cgns)
+    try:
+        cols = ds.list_value_columns()
+        cols.append("changed")
+
+        def fail(self):
+            raise AssertionError("列一覧を再取得した")
+
+        monkeypatch.setattr(DataSource, "_list_cgns_value_columns", fail)
+        assert ds.list_value_columns() == ["depth", "elevation"]
+    finally:
+        ds.close()
+    assert ds._value_cols_cache is None
+
+
+def test_map_ordered_keeps_order() -> None:
+    import time
+
+    from iRIC_DataScope.common.iric_data_source import _map_ordered
+
+    def slow(x: int) -> int:
+        # 後の要素ほど早く終わるようにしても、結果は入力順に返る
+        time.sleep(0.01 * (5 - x))
+        return x * 10
+
+    assert list(_map_ordered(slow, range(5), workers=3)) == [0, 10, 20, 30, 40]
+    assert list(_map_ordered(slow, range(5), workers=1)) == [0, 10, 20, 30, 40]
+
+    gen = _map_ordered(slow, range(5), workers=3)
+    assert next(gen) == 0
+    gen.close()
+
+
+def test_csv_dir_frames_parallel_read(csv_dir: Path, monkeypatch) -> None:
+    monkeypatch.setattr("os.cpu_count", lambda: 4)
+    ds = DataSource.from_input(csv_dir)
+
+    frames = list(ds.iter_frames(value_col="depth(m)"))
+    assert [f.step for f in frames] == [1, 2, 10]
+    assert [f.df["depth(m)"].tolist()[-1] for f in frames] == [4.0, 8.0, 40.0]
+
+
+def test_csv_dir_value_types_inferred_per_file(tmp_path: Path) -> None:
+    _write_result_csv(tmp_path / "Result_1.csv", t=1.0)
+    text = (tmp_path / "Result_1.csv").read_text(encoding="utf-8")
+    # 後のステップだけ値の列に文字列が混ざっていても、そのファイルで型を推定し直す
+    (tmp_path / "Result_2.csv").write_text(text.replace("4.0\n", "dry\n"), encoding="utf-8")
+
+    ds = DataSource.from_input(tmp_path)
+    frames = list(ds.iter_frames(value_col="depth(m)"))
+    assert frames[0].df["depth(m)"].dtype == "float64"
+    assert frames[1].df["depth(m)"].tolist()[-1] == "dry"
@@ -0,0 +1,174 @@
+"""入力フォルダ判定まわりの走査ヘルパーを検証する。"""
+
+from __future__ import annotations
+
+import zipfile
+from pathlib import Path
+
+from iRIC_DataScope.common.iric_project import (
+    classify_input_dir,
+    extract_zip_member,
+    extract_zip_members,
+    has_result_csv,
+    is_valid_input_path,
+    iter_matching_files,
+    list_solution_cgns_in_ipro,
+    parse_solution_step,
+)
+
+
+def _touch(path: Path) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text("", encoding="utf-8")
+    return path
+
+
+def test_iter_matching_files_walks_subdirectories(tmp_path: Path) -> None:
+    a = _touch(tmp_path / "Result_1.csv")
+    b = _touch(tmp_path / "sub" / "deeper" / "Result_2.csv")
+    _touch(tmp_path / "sub" / "other.csv")
+    (tmp_path / "Result_dir.csv").mkdir()
+
+    hits = sorted(iter_matching_files(tmp_path, "Result_*.csv"))
+
+    assert hits == sorted([a, b])
+
+
+def test_iter_matching_files_hidden_and_symlinks(tmp_path: Path) -> None:
+    data = tmp_path / "data"
+    a = _touch(data / "Result_1.csv")
+    hidden = _touch(data / ".cache" / "Result_2.csv")
+    root = tmp_path / "root"
+    root.mkdir()
+    (root / "link").symlink_to(data, target_is_directory=True)
+
+    assert list(iter_matching_files(root, "*.csv")) == []
+    linked = sorted(iter_matching_files(root, "*.csv", follow_symlinks=True))
+    assert linked == sorted([root / "link" / a.name, root / "link" / ".cache" / hidden.name])
+    assert list(iter_matching_files(data, "*.csv", skip_hidden=True)) == [a]
+
+
+def test_has_result_csv(tmp_path: Path) -> None:
+    assert not has_result_csv(tmp_path)
+    _touch(tmp_path / "nested" / "Result_10.csv")
+    assert has_result_csv(tmp_path)
+
+
+def test_has_result_csv_missing_dir(tmp_path: Path) -> None:
+    assert not has_result_csv(tmp_path / "missing")
+
+
+def test_is_valid_input_path_accepts_str_and_path(tmp_path: Path) -> None:
+    ipro = _touch(tmp_path / "case.ipro")
+    other = _touch(tmp_path / "notes.txt")
+    _touch(tmp_path / "csv" / "Result_1.csv")
+
+    assert is_valid_input_path(str(ipro))
+    assert is_valid_input_path(ipro)
+    assert not is_valid_input_path(str(other))
+    assert is_valid_input_path(str(tmp_path / "csv"))
+    assert not is_valid_input_path(str(tmp_path / "missing.ipro"))
+    assert not is_valid_input_path("")
+    assert not is_valid_input_path(None)
+
+
+def test_extract_zip_member(tmp_path: Path) -> None:
+    payload = bytes(range(256)) * 1024
+    ipro = tmp_path / "project.ipro"
+    with zipfile.ZipFile(ipro, "w", compression=zipfile.ZIP_DEFLATED) as z:
+        z.writestr("Case1/Solution1.cgn", payload)
+
+    with zipfile.ZipFile(ipro) as z:
+        out = extract_zip_member(z, "Case1/Solution1.cgn", tmp_path / "Solution1.cgn")
+
+    assert out.read_bytes() == payload
+
+
+def test_parse_solution_step() -> None:
+    assert parse_solution_step("Solution12.cgn") == 12
+    assert parse_solution_step("solution3.CGN") == 3
+    assert parse_solution_step("Case1.cgn") is None
+
+
+def test_list_solution_cgns_in_ipro_sorted_by_step(tmp_path: Path) -> None:
+    ipro = tmp_path / "project.ipro"
+    with zipfile.ZipFile(ipro, "w") as z:
+        for name in ["result/Solution10.cgn", "result/Solution2.cgn", "Solution1.cgn", "MySolution3.cgn", "Case1.cgn"]:
+            z.writestr(name, b"")
+
+    assert list_solution_cgns_in_ipro(ipro) == ["Solution1.cgn", "result/Solution2.cgn", "result/Solution10.cgn"]
+    assert list_solution_cgns_in_ipro(tmp_path / "missing.ipro") == []
+
+
+def test_extract_zip_members_keeps_order(tmp_path: Path, monkeypatch) -> None:
+    zip_path = tmp_path / "project.ipro"
+    names = [f"result/Solution{i}.cgn" for i in range(1, 6)]
+    with zipfile.ZipFile(zip_path, "w", compression=zipfile.ZIP_DEFLATED) as z:
+        for i, name in enumerate(names, start=1):
+            z.writestr(name, bytes([i]) * 1000)
+
+    # 並列経路を通すため、CPU 数に関わらずスレッドを使わせる
+    monkeypatch.setattr("os.cpu_count", lambda: 4)
+    out_dir = tmp_path / "out"
+    out_dir.mkdir()
+    paths = extract_zip_members(zip_path, names, out_dir)
+
+    assert [p.name for p in paths] == [f"Solution{i}.cgn" for i in range(1, 6)]
+    assert [p.read_bytes() for p in paths] == [bytes([i]) * 1000 for i in range(1, 6)]
+
+
+def test_classify_input_dir_sees_nested_changes(tmp_path: Path) -> None:
+    _touch(tmp_path / "csv" / "Result_1.csv")
+    assert classify_input_dir(tmp_path) == "csv_dir"
+
+    # 配下のフォルダへの追加はフォルダの更新時刻に現れないが、判定には反映される
+    _touch(tmp_path / "csv" / "Case1.cgn")
+    assert classify_input_dir(tmp_path) == "project_dir"
+
+
+def test_discover_project_cgns_walks_subdirectories(tmp_path: Path) -> None:
+    from iRIC_DataScope.common.iric_project import discover_project_cgns, find_case_cgn
+
+    s10 = _touch(tmp_path / "result" / "Solution10.cgn")
+    s2 = _touch(tmp_path / "result" / "deep" / "Solution2.cgn")
+    # ファイル名が一致してもフォルダは対象外
+    (tmp_path / "Solution1.cgn").mkdir()
+
+    info = discover_project_cgns(tmp_path)
+    assert info.kind == "series"
+    assert info.paths == [s2, s10]
+    assert find_case_cgn(tmp_path, "Case1.cgn") is None
+
+    case = _touch(tmp_path / "other" / "Case1.cgn")
+    assert find_case_cgn(tmp_path, "Case1.cgn") == case
+
+
+def test_classify_input_dir_top_level_case_skips_walk(tmp_path: Path, monkeypatch) -> None:
+    import iRIC_DataScope.common.iric_project as iric_project
+
+    _touch(tmp_path / "Case1.cgn")
+    _touch(tmp_path / "csv" / "Result_1.csv")
+
+    def fail(*args, **kwargs):
+        raise AssertionError("配下を走査した")
+
+    monkeypatch.setattr(iric_project, "iter_matching_files", fail)
+    assert classify_input_dir(tmp_path) == "project_dir"
+
+
+def test_extract_zip_members_duplicate_basenames_are_deterministic(tmp_path: Path, monkeypatch) -> None:
+    zip_path = tmp_path / "project.ipro"
+    names = ["a/Solution1.cgn", "b/Solution2.cgn", "c/Solution1.cgn", "d/Solution3.cgn"]
+    with zipfile.ZipFile(zip_path, "w") as z:
+        for i, name in enumerate(names, start=1):
+            z.writestr(name, bytes([i]) * 100_000)
+
+    monkeypatch.setattr("os.cpu_count", lambda: 4)
+    out_dir = tmp_path / "out"
+    out_dir.mkdir()
+    paths = extract_zip_members(zip_path, names, out_dir)
+
+    # 同じファイル名は names の順に書き出され、後のメンバーが残る
+    assert paths[0] == paths[2]
+    assert paths[0].read_bytes() == bytes([3]) * 100_000
+    assert paths[3].read_bytes() == bytes([4]) * 100_000
@@ -0,0 +1,38 @@
+"""パッケージ import 時に重い依存を読み込まないことを検証する。"""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+
+
+def _loaded_after(code: str) -> str:
+    script = (
+        f"{code}\n"
+        "import sys\n"
+        "print(','.join(m for m in ('numpy', 'pandas', 'h5py', 'matplotlib') if m in sys.modules))\n"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", script],
+        cwd=ROOT_DIR,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return out.stdout.strip()
+
+
+def test_package_import_is_lightweight() -> None:
+    assert _loaded_after("import iRIC_DataScope") == ""
+
+
+def test_launcher_attribute_is_resolved_lazily() -> None:
+    loaded = _loaded_after(
+        "import iRIC_DataScope\n"
+        "from iRIC_DataScope.lr_wse.launcher import launch_from_launcher\n"
+        "assert iRIC_DataScope.launch_lr_wse is launch_from_launcher\n"
+    )
+    assert "pandas" in loaded